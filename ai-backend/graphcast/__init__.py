@@ -10,6 +10,7 @@ from .inference_pipeline import (
     GraphCastInferencePipeline,
     ForecastResult,
     ForecastDay,
+    ForecastDaysSoA,
     ForecastMetadata,
     Location,
     RawWeatherData,
@@ -23,6 +24,7 @@ __all__ = [
     "GraphCastInferencePipeline",
     "ForecastResult",
     "ForecastDay",
+    "ForecastDaysSoA",
     "ForecastMetadata",
     "Location",
     "RawWeatherData",
@@ -1,21 +1,121 @@
 """
 Agricultural Metrics Calculator
 Derives farming-relevant metrics from raw weather predictions for Maharashtra region.
-Optimized with vectorized NumPy operations for performance.
+Optimized with vectorized NumPy operations for performance. Weather inputs
+are processed as float32; thresholds stay Python floats, which NumPy does not
+let upcast float32 arrays.
 """
 
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Any, Mapping
 import numpy as np
-from .config import AGRICULTURAL_THRESHOLDS
+from .config import AGRICULTURAL_THRESHOLDS, build_crop_temperature_table
 from .profiler import get_profiler
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Get global profiler
 profiler = get_profiler()
 
+# Level labels and the score boundaries separating them (lower bound inclusive)
+_RISK_LEVELS = ("low", "moderate", "high")
+_RISK_LEVEL_BOUNDS = np.array([30.0, 60.0])
+_MOISTURE_LEVELS = ("dry", "optimal", "saturated")
+_MOISTURE_LEVEL_BOUNDS = np.array([30.0, 80.0])
+
+
+if njit is not None:
+    # Explicit signatures compile eagerly at import (or load from the on-disk cache)
+    @njit("void(f4[::1], f4[::1], f4[::1], f8, f8, f8, f8, f4[::1])", fastmath=True, cache=True)
+    def _rain_risk_kernel(daily, cumul, intens, low, mod, high_cumul, ffi, out):
+        """Fused per-element rainfall risk (daily + cumulative + intensity components)."""
+        for i in range(daily.shape[0]):
+            d = daily[i]
+            if d < low:
+                daily_risk = 0.0
+            elif d < mod:
+                daily_risk = 20.0 * (d - low) / (mod - low)
+            else:
+                daily_risk = 20.0 + min(20.0, (d - mod) / 2.0)
+            
+            cumulative_risk = min(30.0, 30.0 * cumul[i] / high_cumul)
+            
+            x = intens[i]
+            if x >= ffi:
+                intensity_risk = min(30.0, 15.0 + (x - ffi))
+            else:
+                intensity_risk = 15.0 * x / ffi
+            
+            out[i] = min(100.0, daily_risk + cumulative_risk + intensity_risk)
+else:
+    _rain_risk_kernel = None
+
+
+def _soil_balance(eff_precip, et, fc, wp, drain_coef, m0, moist_out, drain_out):
+    """
+    Sequential soil water balance; fills moisture/drainage outputs and returns final moisture.
+    
+    The state carry between days prevents vectorization, so this loop is
+    compiled with Numba when available and runs as plain Python otherwise.
+    """
+    m = m0
+    for i in range(eff_precip.shape[0]):
+        m += eff_precip[i] - et[i]
+        
+        # Drain a fraction of any water above field capacity
+        d = (m - fc) * drain_coef if m > fc else 0.0
+        m -= d
+        
+        # Apply constraints
+        if m < wp:
+            m = wp
+        elif m > fc:
+            m = fc
+        
+        moist_out[i] = m
+        drain_out[i] = d
+    return m
+
+
+if njit is not None:
+    _soil_balance = njit(
+        "f8(f4[::1], f4[::1], f8, f8, f8, f8, f4[::1], f4[::1])", cache=True
+    )(_soil_balance)
+
+
+_kernels_warm = False
+
+
+def _prep(a):
+    """Return ``a`` as a C-contiguous float32 array (no copy if it already is)."""
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
+def _deviation_risk(deviation: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Risk points (0-50) for a non-negative temperature deviation from the optimal range.
+    
+    Linear up to 10 points at the threshold, then 4 points per degree beyond
+    it capped at 40 more. Computed branch-free in two buffers.
+    """
+    excess = np.subtract(deviation, threshold)
+    excess *= 4.0
+    np.clip(excess, 0.0, 40.0, out=excess)
+    
+    risk = np.minimum(deviation, threshold)
+    risk /= threshold
+    risk *= 10.0
+    risk += excess
+    return risk
+
 
-@dataclass
+@dataclass(slots=True)
 class RainfallRisk:
     """Rainfall risk assessment for a specific day."""
     date: datetime
@@ -26,7 +126,7 @@ class RainfallRisk:
     risk_level: str  # "low", "moderate", "high"
 
 
-@dataclass
+@dataclass(slots=True)
 class TempExtremeRisk:
     """Temperature extreme risk assessment for a specific day."""
     date: datetime
@@ -38,7 +138,7 @@ class TempExtremeRisk:
     risk_level: str  # "low", "moderate", "high"
 
 
-@dataclass
+@dataclass(slots=True)
 class SoilMoistureProxy:
     """Soil moisture proxy estimation for a specific day."""
     date: datetime
@@ -49,6 +149,143 @@ class SoilMoistureProxy:
     moisture_level: str  # "dry", "optimal", "saturated"
 
 
+class _MetricSeries(Sequence, ABC):
+    """
+    Columnar (one array per field) container for per-day metric results.
+    
+    Bulk consumers read the array fields directly; indexing or iterating
+    builds the per-day dataclass on demand for backward compatibility.
+    """
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("series index out of range")
+        return self._build(index)
+    
+    def __iter__(self):
+        # Bulk-convert the columns to Python scalars once (ndarray.tolist) instead
+        # of boxing and float()-coercing every element through __getitem__
+        columns = [
+            column.tolist() if isinstance(column, np.ndarray) else column
+            for column in self._item_columns()
+        ]
+        for values in zip(*columns):
+            yield self._make_item(*values)
+    
+    def _build(self, i: int):
+        return self._make_item(*(column[i] for column in self._item_columns()))
+    
+    @abstractmethod
+    def _item_columns(self) -> list:
+        """Columns in the per-day dataclass's field order."""
+    
+    @abstractmethod
+    def _make_item(self, *values):
+        """Build the per-day dataclass from one value per column."""
+
+
+@dataclass(eq=False)
+class RainfallRiskSeries(_MetricSeries):
+    """Rainfall risk assessments for a forecast horizon, stored column-wise."""
+    dates: List[datetime]
+    risk_scores: np.ndarray  # 0-100
+    daily_precipitation_mm: np.ndarray
+    cumulative_7day_mm: np.ndarray
+    intensity_mm_per_hour: np.ndarray
+    level_indices: np.ndarray  # index into ("low", "moderate", "high")
+    
+    @property
+    def risk_levels(self) -> np.ndarray:
+        """Risk level label for each day."""
+        return np.asarray(_RISK_LEVELS)[self.level_indices]
+    
+    def _item_columns(self) -> list:
+        return [
+            self.dates, self.risk_scores, self.daily_precipitation_mm,
+            self.cumulative_7day_mm, self.intensity_mm_per_hour, self.level_indices
+        ]
+    
+    def _make_item(self, date, risk_score, precip, cumulative, intensity, level) -> RainfallRisk:
+        return RainfallRisk(
+            date=date,
+            risk_score=float(risk_score),
+            daily_precipitation_mm=float(precip),
+            cumulative_7day_mm=float(cumulative),
+            intensity_mm_per_hour=float(intensity),
+            risk_level=_RISK_LEVELS[level]
+        )
+
+
+@dataclass(eq=False)
+class TempExtremeRiskSeries(_MetricSeries):
+    """Temperature extreme risk assessments for a forecast horizon, stored column-wise."""
+    dates: List[datetime]
+    risk_scores: np.ndarray  # 0-100
+    temp_max_c: np.ndarray
+    temp_min_c: np.ndarray
+    optimal_min_c: float
+    optimal_max_c: float
+    level_indices: np.ndarray  # index into ("low", "moderate", "high")
+    
+    @property
+    def risk_levels(self) -> np.ndarray:
+        """Risk level label for each day."""
+        return np.asarray(_RISK_LEVELS)[self.level_indices]
+    
+    def _item_columns(self) -> list:
+        return [self.dates, self.risk_scores, self.temp_max_c, self.temp_min_c, self.level_indices]
+    
+    def _make_item(self, date, risk_score, t_max, t_min, level) -> TempExtremeRisk:
+        return TempExtremeRisk(
+            date=date,
+            risk_score=float(risk_score),
+            temp_max_c=float(t_max),
+            temp_min_c=float(t_min),
+            optimal_min_c=self.optimal_min_c,
+            optimal_max_c=self.optimal_max_c,
+            risk_level=_RISK_LEVELS[level]
+        )
+
+
+@dataclass(eq=False)
+class SoilMoistureSeries(_MetricSeries):
+    """Soil moisture proxy estimates for a forecast horizon, stored column-wise."""
+    dates: List[datetime]
+    moisture_percent: np.ndarray  # 0-100
+    precipitation_mm: np.ndarray
+    evapotranspiration_mm: np.ndarray
+    drainage_mm: np.ndarray
+    level_indices: np.ndarray  # index into ("dry", "optimal", "saturated")
+    
+    @property
+    def moisture_levels(self) -> np.ndarray:
+        """Moisture level label for each day."""
+        return np.asarray(_MOISTURE_LEVELS)[self.level_indices]
+    
+    def _item_columns(self) -> list:
+        return [
+            self.dates, self.moisture_percent, self.precipitation_mm,
+            self.evapotranspiration_mm, self.drainage_mm, self.level_indices
+        ]
+    
+    def _make_item(self, date, moisture, precip, et, drainage, level) -> SoilMoistureProxy:
+        return SoilMoistureProxy(
+            date=date,
+            moisture_percent=float(moisture),
+            precipitation_mm=float(precip),
+            evapotranspiration_mm=float(et),
+            drainage_mm=float(drainage),
+            moisture_level=_MOISTURE_LEVELS[level]
+        )
+
+
 class AgriculturalMetricsCalculator:
     """
     Calculate agricultural metrics from weather forecast data.
@@ -58,7 +295,7 @@ class AgriculturalMetricsCalculator:
     thresholds calibrated for Maharashtra agriculture.
     """
     
-    def __init__(self, region_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, region_config: Optional[Mapping[str, Any]] = None):
         """
         Initialize calculator with region-specific thresholds.
         
@@ -73,8 +310,55 @@ class AgriculturalMetricsCalculator:
         self.soil_config = self.config["soil_moisture"]
         self.confidence_config = self.config["confidence"]
         
+        # Crop optimal ranges as arrays (matches config.TEMP_OPT_MIN/MAX for the defaults)
+        self._crop_index, self._temp_opt_min, self._temp_opt_max = build_crop_temperature_table(
+            self.temp_config
+        )
+        self._default_crop = self._crop_index["default"]
+        
+        # Unpack scalar thresholds once so the hot paths skip per-call dict lookups
+        # (kernel arguments are coerced to float to match the compiled signatures)
+        self._window_days = self.rainfall_config["cumulative_window_days"]
+        self._low_thresh = float(self.rainfall_config["low_threshold"])
+        self._mod_thresh = float(self.rainfall_config["moderate_threshold"])
+        self._high_cumul_thresh = float(self.rainfall_config["high_cumulative_threshold"])
+        self._flash_flood_intensity = float(self.rainfall_config["flash_flood_intensity"])
+        self._deviation_threshold = self.temp_extreme_config["deviation_threshold"]
+        self._extreme_heat = self.temp_extreme_config["extreme_heat_threshold"]
+        self._extreme_cold = self.temp_extreme_config["extreme_cold_threshold"]
+        self._field_capacity = self.soil_config["field_capacity"]
+        self._wilting_point = self.soil_config["wilting_point"]
+        self._precip_efficiency = self.soil_config["precipitation_efficiency"]
+        self._drainage_coef = self.soil_config["drainage_coefficient"]
+        self._base_et = self.soil_config["evapotranspiration_base"]
+        self._et_temp_coef = self.soil_config["et_temp_coefficient"]
+        self._base_confidence = self.confidence_config["base_confidence"]
+        self._decay_rate = self.confidence_config["decay_rate"]
+        self._min_confidence = self.confidence_config["min_confidence"]
+        
         # Initialize soil moisture state
         self.soil_moisture_state = self.soil_config["initial_moisture"]
+        
+        self._warmup()
+    
+    @staticmethod
+    def _warmup():
+        """
+        Run each compiled kernel once on a one-element input.
+        
+        Kernels are compiled eagerly at import; this also primes their dispatch
+        so the first forecast request does not pay any one-time cost. Runs once
+        per process.
+        """
+        global _kernels_warm
+        if _kernels_warm:
+            return
+        
+        one = np.ones(1, dtype=np.float32)
+        if _rain_risk_kernel is not None:
+            _rain_risk_kernel(one, one, one, 5.0, 25.0, 100.0, 10.0, np.empty_like(one))
+        _soil_balance(one, one, 100.0, 0.0, 0.1, 50.0, np.empty_like(one), np.empty_like(one))
+        _kernels_warm = True
     
     @profiler.profile_function("calculate_rainfall_risk")
     def calculate_rainfall_risk(
@@ -82,7 +366,7 @@ class AgriculturalMetricsCalculator:
         precipitation: np.ndarray,
         dates: List[datetime],
         hours_per_timestep: float = 24.0
-    ) -> List[RainfallRisk]:
+    ) -> RainfallRiskSeries:
         """
         Calculate daily rainfall risk scores (0-100) using vectorized operations.
         
@@ -97,44 +381,102 @@ class AgriculturalMetricsCalculator:
             hours_per_timestep: Hours covered by each precipitation value (default: 24)
             
         Returns:
-            List of RainfallRisk objects, one per day
+            RainfallRiskSeries with one entry per day
         """
-        n_days = len(precipitation)
+        precipitation = _prep(precipitation)
+        cumulatives, intensities, risk_scores, level_indices = self._calculate_rainfall_components(
+            precipitation, hours_per_timestep
+        )
+        
+        return RainfallRiskSeries(
+            dates=dates,
+            risk_scores=risk_scores,
+            daily_precipitation_mm=precipitation,
+            cumulative_7day_mm=cumulatives,
+            intensity_mm_per_hour=intensities,
+            level_indices=level_indices
+        )
+    
+    @profiler.profile_function("calculate_rainfall_risk_batch")
+    def calculate_rainfall_risk_batch(
+        self,
+        precipitation: np.ndarray,
+        dates: List[datetime],
+        hours_per_timestep: float = 24.0
+    ) -> List[RainfallRiskSeries]:
+        """
+        Calculate daily rainfall risk for several locations in one vectorized pass.
+        
+        Args:
+            precipitation: Array of shape (n_locations, n_days) with precipitation in mm
+            dates: List of datetime objects for each forecast day (shared by all locations)
+            hours_per_timestep: Hours covered by each precipitation value (default: 24)
+        
+        Returns:
+            List with one RainfallRiskSeries per location; each series views a row
+            of the batch arrays, so per-day objects are only built when indexed
+        """
+        precipitation = _prep(precipitation)
+        if precipitation.ndim != 2:
+            raise ValueError(
+                f"precipitation must have shape (n_locations, n_days), got {precipitation.shape}"
+            )
+        
+        cumulatives, intensities, risk_scores, level_indices = self._calculate_rainfall_components(
+            precipitation, hours_per_timestep
+        )
+        
+        return [
+            RainfallRiskSeries(
+                dates=dates,
+                risk_scores=risk_scores[k],
+                daily_precipitation_mm=precipitation[k],
+                cumulative_7day_mm=cumulatives[k],
+                intensity_mm_per_hour=intensities[k],
+                level_indices=level_indices[k]
+            )
+            for k in range(precipitation.shape[0])
+        ]
+    
+    def _calculate_rainfall_components(
+        self,
+        precipitation: np.ndarray,
+        hours_per_timestep: float
+    ) -> tuple:
+        """
+        Compute rainfall risk inputs and scores along the last (day) axis.
+        
+        Args:
+            precipitation: float32 array of precipitation in mm, days on the last axis
+            hours_per_timestep: Hours covered by each precipitation value
+        
+        Returns:
+            Tuple of (cumulatives, intensities, risk_scores, level_indices) arrays,
+            each shaped like precipitation
+        """
+        n_days = precipitation.shape[-1]
         
         # Vectorized intensity calculation
         intensities = precipitation / hours_per_timestep if hours_per_timestep > 0 else np.zeros_like(precipitation)
         
-        # Vectorized cumulative precipitation using rolling window
-        window_days = self.rainfall_config["cumulative_window_days"]
-        cumulatives = np.array([
-            np.sum(precipitation[max(0, i - window_days + 1):i+1])
-            for i in range(n_days)
-        ])
+        # Vectorized cumulative precipitation using rolling window (prefix-sum difference)
+        window_days = self._window_days
+        prefix_sums = np.empty(precipitation.shape[:-1] + (n_days + 1,), dtype=np.float64)
+        prefix_sums[..., 0] = 0.0
+        np.cumsum(precipitation, axis=-1, dtype=np.float64, out=prefix_sums[..., 1:])
+        window_ends = np.arange(1, n_days + 1)
+        window_starts = np.maximum(0, window_ends - window_days)
+        cumulatives = (prefix_sums[..., window_ends] - prefix_sums[..., window_starts]).astype(np.float32)
         
         # Vectorized risk score calculation
         risk_scores = self._calculate_rainfall_risk_scores_vectorized(
             precipitation, cumulatives, intensities
         )
         
-        # Vectorized risk level determination
-        risk_levels = np.where(risk_scores < 30, "low",
-                              np.where(risk_scores < 60, "moderate", "high"))
-        
-        # Build result list
-        risks = [
-            RainfallRisk(
-                date=date,
-                risk_score=float(risk_score),
-                daily_precipitation_mm=float(precip),
-                cumulative_7day_mm=float(cumulative),
-                intensity_mm_per_hour=float(intensity),
-                risk_level=risk_level
-            )
-            for date, risk_score, precip, cumulative, intensity, risk_level
-            in zip(dates, risk_scores, precipitation, cumulatives, intensities, risk_levels)
-        ]
+        # Vectorized risk level determination (integer bucket per day)
+        level_indices = np.searchsorted(_RISK_LEVEL_BOUNDS, risk_scores, side="right")
         
-        return risks
+        return cumulatives, intensities, risk_scores, level_indices
     
     def _calculate_rainfall_risk_scores_vectorized(
         self,
@@ -153,26 +495,31 @@ class AgriculturalMetricsCalculator:
         Returns:
             Array of risk scores from 0-100
         """
-        low_thresh = self.rainfall_config["low_threshold"]
-        mod_thresh = self.rainfall_config["moderate_threshold"]
-        high_cumul_thresh = self.rainfall_config["high_cumulative_threshold"]
-        flash_flood_intensity = self.rainfall_config["flash_flood_intensity"]
-        
-        # Component 1: Daily precipitation risk (0-40 points) - vectorized
-        daily_risk = np.zeros_like(daily_precip)
-        
-        # Low range
-        mask_low = daily_precip < low_thresh
-        daily_risk[mask_low] = 0.0
-        
-        # Moderate range
-        mask_mod = (daily_precip >= low_thresh) & (daily_precip < mod_thresh)
-        daily_risk[mask_mod] = 20.0 * (daily_precip[mask_mod] - low_thresh) / (mod_thresh - low_thresh)
+        low_thresh = self._low_thresh
+        mod_thresh = self._mod_thresh
+        high_cumul_thresh = self._high_cumul_thresh
+        flash_flood_intensity = self._flash_flood_intensity
+        
+        # Single fused pass when Numba is available
+        if _rain_risk_kernel is not None:
+            # The kernel is element-wise, so batched inputs run as flat views
+            daily_precip = np.ascontiguousarray(daily_precip, dtype=np.float32)
+            risk_scores = np.empty_like(daily_precip)
+            _rain_risk_kernel(
+                daily_precip.reshape(-1),
+                np.ascontiguousarray(cumulative_precip, dtype=np.float32).reshape(-1),
+                np.ascontiguousarray(intensity, dtype=np.float32).reshape(-1),
+                low_thresh, mod_thresh, high_cumul_thresh, flash_flood_intensity,
+                risk_scores.reshape(-1)
+            )
+            return risk_scores
         
-        # High range
-        mask_high = daily_precip >= mod_thresh
-        excess = daily_precip[mask_high] - mod_thresh
-        daily_risk[mask_high] = 20.0 + np.minimum(20.0, excess / 2.0)
+        # Component 1: Daily precipitation risk (0-40 points) - first matching range wins
+        daily_risk = np.select(
+            [daily_precip < low_thresh, daily_precip < mod_thresh],
+            [0.0, 20.0 * (daily_precip - low_thresh) / (mod_thresh - low_thresh)],
+            default=20.0 + np.minimum(20.0, (daily_precip - mod_thresh) / 2.0)
+        )
         
         # Component 2: Cumulative precipitation risk (0-30 points) - vectorized
         cumulative_risk = np.minimum(30.0, 30.0 * cumulative_precip / high_cumul_thresh)
@@ -206,13 +553,26 @@ class AgriculturalMetricsCalculator:
         Returns:
             Risk score from 0-100
         """
-        # Use vectorized version with single values
-        result = self._calculate_rainfall_risk_scores_vectorized(
-            np.array([daily_precip]),
-            np.array([cumulative_precip]),
-            np.array([intensity])
-        )
-        return float(result[0])
+        # Plain arithmetic - NumPy dispatch costs more than the math for one value
+        low_thresh = self._low_thresh
+        mod_thresh = self._mod_thresh
+        flash_flood_intensity = self._flash_flood_intensity
+        
+        if daily_precip < low_thresh:
+            daily_risk = 0.0
+        elif daily_precip < mod_thresh:
+            daily_risk = 20.0 * (daily_precip - low_thresh) / (mod_thresh - low_thresh)
+        else:
+            daily_risk = 20.0 + min(20.0, (daily_precip - mod_thresh) / 2.0)
+        
+        cumulative_risk = min(30.0, 30.0 * cumulative_precip / self._high_cumul_thresh)
+        
+        if intensity >= flash_flood_intensity:
+            intensity_risk = min(30.0, 15.0 + (intensity - flash_flood_intensity))
+        else:
+            intensity_risk = 15.0 * intensity / flash_flood_intensity
+        
+        return float(min(100.0, daily_risk + cumulative_risk + intensity_risk))
 
     @profiler.profile_function("calculate_temperature_extreme_risk")
     def calculate_temperature_extreme_risk(
@@ -222,7 +582,7 @@ class AgriculturalMetricsCalculator:
         dates: List[datetime],
         crop: str = "default",
         growth_stage_weight: Optional[float] = None
-    ) -> List[TempExtremeRisk]:
+    ) -> TempExtremeRiskSeries:
         """
         Calculate temperature extreme risk scores (0-100) using vectorized operations.
         
@@ -237,14 +597,15 @@ class AgriculturalMetricsCalculator:
             growth_stage_weight: Optional multiplier for growth stage sensitivity (1.0-2.0)
             
         Returns:
-            List of TempExtremeRisk objects, one per day
+            TempExtremeRiskSeries with one entry per day
         """
-        # Get optimal temperature range for crop
-        if crop not in self.temp_config:
-            crop = "default"
-        optimal_range = self.temp_config[crop]
-        optimal_min = optimal_range["min"]
-        optimal_max = optimal_range["max"]
+        temp_max = _prep(temp_max)
+        temp_min = _prep(temp_min)
+        
+        # Get optimal temperature range for crop (unknown crops use "default")
+        crop_idx = self._crop_index.get(crop, self._default_crop)
+        optimal_min = float(self._temp_opt_min[crop_idx])
+        optimal_max = float(self._temp_opt_max[crop_idx])
         
         # Default growth stage weight
         if growth_stage_weight is None:
@@ -255,26 +616,18 @@ class AgriculturalMetricsCalculator:
             temp_max, temp_min, optimal_min, optimal_max, growth_stage_weight
         )
         
-        # Vectorized risk level determination
-        risk_levels = np.where(risk_scores < 30, "low",
-                              np.where(risk_scores < 60, "moderate", "high"))
-        
-        # Build result list
-        risks = [
-            TempExtremeRisk(
-                date=date,
-                risk_score=float(risk_score),
-                temp_max_c=float(t_max),
-                temp_min_c=float(t_min),
-                optimal_min_c=optimal_min,
-                optimal_max_c=optimal_max,
-                risk_level=risk_level
-            )
-            for date, risk_score, t_max, t_min, risk_level
-            in zip(dates, risk_scores, temp_max, temp_min, risk_levels)
-        ]
-        
-        return risks
+        # Vectorized risk level determination (integer bucket per day)
+        level_indices = np.searchsorted(_RISK_LEVEL_BOUNDS, risk_scores, side="right")
+        
+        return TempExtremeRiskSeries(
+            dates=dates,
+            risk_scores=risk_scores,
+            temp_max_c=temp_max,
+            temp_min_c=temp_min,
+            optimal_min_c=optimal_min,
+            optimal_max_c=optimal_max,
+            level_indices=level_indices
+        )
     
     def _calculate_temperature_risk_scores_vectorized(
         self,
@@ -297,38 +650,31 @@ class AgriculturalMetricsCalculator:
         Returns:
             Array of risk scores from 0-100
         """
-        deviation_threshold = self.temp_extreme_config["deviation_threshold"]
-        extreme_heat = self.temp_extreme_config["extreme_heat_threshold"]
-        extreme_cold = self.temp_extreme_config["extreme_cold_threshold"]
+        deviation_threshold = self._deviation_threshold
+        extreme_heat = self._extreme_heat
+        extreme_cold = self._extreme_cold
         
-        # Calculate deviations from optimal range - vectorized
-        max_temp_deviation = np.maximum(0.0, temp_max - optimal_max)
-        min_temp_deviation = np.maximum(0.0, optimal_min - temp_min)
+        # Calculate deviations from optimal range - vectorized, in place
+        max_temp_deviation = np.subtract(temp_max, optimal_max, dtype=np.float32)
+        np.maximum(max_temp_deviation, 0.0, out=max_temp_deviation)
+        min_temp_deviation = np.subtract(optimal_min, temp_min, dtype=np.float32)
+        np.maximum(min_temp_deviation, 0.0, out=min_temp_deviation)
         
-        # Risk from maximum temperature deviation (0-50 points) - vectorized
-        max_risk = np.where(
-            max_temp_deviation <= deviation_threshold,
-            10.0 * (max_temp_deviation / deviation_threshold),
-            10.0 + np.minimum(40.0, 4.0 * (max_temp_deviation - deviation_threshold))
-        )
+        # Risk from maximum/minimum temperature deviation (0-50 points each)
+        max_risk = _deviation_risk(max_temp_deviation, deviation_threshold)
+        min_risk = _deviation_risk(min_temp_deviation, deviation_threshold)
         
-        # Risk from minimum temperature deviation (0-50 points) - vectorized
-        min_risk = np.where(
-            min_temp_deviation <= deviation_threshold,
-            10.0 * (min_temp_deviation / deviation_threshold),
-            10.0 + np.minimum(40.0, 4.0 * (min_temp_deviation - deviation_threshold))
-        )
+        # Total risk with growth stage weighting - accumulated in place
+        weighted_risk = max_risk
+        weighted_risk += min_risk
         
-        # Extreme temperature penalties - vectorized
-        extreme_penalty = np.zeros_like(temp_max)
-        extreme_penalty += np.where(temp_max >= extreme_heat, 20.0, 0.0)
-        extreme_penalty += np.where(temp_min <= extreme_cold, 20.0, 0.0)
+        # Extreme temperature penalties (20 points each) - masked adds, no penalty array
+        np.add(weighted_risk, 20.0, out=weighted_risk, where=temp_max >= extreme_heat)
+        np.add(weighted_risk, 20.0, out=weighted_risk, where=temp_min <= extreme_cold)
         
-        # Total risk with growth stage weighting - vectorized
-        base_risk = max_risk + min_risk + extreme_penalty
-        weighted_risk = base_risk * growth_stage_weight
+        weighted_risk *= growth_stage_weight
         
-        return np.minimum(100.0, weighted_risk)
+        return np.minimum(weighted_risk, 100.0, out=weighted_risk)
     
     def _calculate_temperature_risk_score(
         self,
@@ -351,15 +697,20 @@ class AgriculturalMetricsCalculator:
         Returns:
             Risk score from 0-100
         """
-        # Use vectorized version with single values
-        result = self._calculate_temperature_risk_scores_vectorized(
-            np.array([temp_max]),
-            np.array([temp_min]),
-            optimal_min,
-            optimal_max,
-            growth_stage_weight
-        )
-        return float(result[0])
+        # Plain arithmetic - NumPy dispatch costs more than the math for one value
+        threshold = self._deviation_threshold
+        
+        risk = 0.0
+        for deviation in (max(0.0, temp_max - optimal_max), max(0.0, optimal_min - temp_min)):
+            risk += min(deviation, threshold) / threshold * 10.0
+            risk += min(40.0, max(0.0, (deviation - threshold) * 4.0))
+        
+        if temp_max >= self._extreme_heat:
+            risk += 20.0
+        if temp_min <= self._extreme_cold:
+            risk += 20.0
+        
+        return float(min(risk * growth_stage_weight, 100.0))
 
     @profiler.profile_function("calculate_soil_moisture_proxy")
     def calculate_soil_moisture_proxy(
@@ -369,7 +720,7 @@ class AgriculturalMetricsCalculator:
         humidity: np.ndarray,
         dates: List[datetime],
         initial_moisture: Optional[float] = None
-    ) -> List[SoilMoistureProxy]:
+    ) -> SoilMoistureSeries:
         """
         Estimate soil moisture using simplified water balance model with optimized calculations.
         
@@ -383,67 +734,56 @@ class AgriculturalMetricsCalculator:
             initial_moisture: Optional initial soil moisture (0-100%). If None, uses config default
             
         Returns:
-            List of SoilMoistureProxy objects, one per day
+            SoilMoistureSeries with one entry per day
         """
         if initial_moisture is not None:
             self.soil_moisture_state = initial_moisture
         
-        field_capacity = self.soil_config["field_capacity"]
-        wilting_point = self.soil_config["wilting_point"]
-        precip_efficiency = self.soil_config["precipitation_efficiency"]
-        drainage_coef = self.soil_config["drainage_coefficient"]
+        precipitation = _prep(precipitation)
+        temperature = _prep(temperature)
+        humidity = _prep(humidity)
+        
+        field_capacity = self._field_capacity
+        wilting_point = self._wilting_point
+        precip_efficiency = self._precip_efficiency
+        drainage_coef = self._drainage_coef
         
         n_days = len(precipitation)
         
         # Pre-allocate arrays for results
-        moisture_states = np.zeros(n_days)
-        et_values = np.zeros(n_days)
-        drainage_values = np.zeros(n_days)
+        moisture_states = np.empty(n_days, dtype=np.float32)
+        drainage_values = np.empty(n_days, dtype=np.float32)
         
         # Vectorized ET calculation
-        et_values = self._calculate_evapotranspiration_vectorized(temperature, humidity)
+        et_values = np.ascontiguousarray(
+            self._calculate_evapotranspiration_vectorized(temperature, humidity), dtype=np.float32
+        )
         
         # Calculate effective precipitation
-        effective_precip = precipitation * precip_efficiency
+        effective_precip = np.ascontiguousarray(precipitation * precip_efficiency, dtype=np.float32)
         
         # Iterative moisture calculation (cannot be fully vectorized due to state dependency)
-        current_moisture = self.soil_moisture_state
-        for i in range(n_days):
-            # Update soil moisture
-            current_moisture += effective_precip[i] - et_values[i]
-            
-            # Calculate drainage for excess water
-            if current_moisture > field_capacity:
-                excess = current_moisture - field_capacity
-                drainage_values[i] = excess * drainage_coef
-                current_moisture -= drainage_values[i]
-            
-            # Apply constraints
-            current_moisture = max(wilting_point, min(field_capacity, current_moisture))
-            moisture_states[i] = current_moisture
+        current_moisture = _soil_balance(
+            effective_precip, et_values,
+            float(field_capacity), float(wilting_point), float(drainage_coef),
+            float(self.soil_moisture_state),
+            moisture_states, drainage_values
+        )
         
         # Update state
-        self.soil_moisture_state = current_moisture
-        
-        # Vectorized moisture level determination
-        moisture_levels = np.where(moisture_states < 30, "dry",
-                                  np.where(moisture_states < 80, "optimal", "saturated"))
-        
-        # Build result list
-        moisture_proxies = [
-            SoilMoistureProxy(
-                date=date,
-                moisture_percent=float(moisture),
-                precipitation_mm=float(precip),
-                evapotranspiration_mm=float(et),
-                drainage_mm=float(drainage),
-                moisture_level=moisture_level
-            )
-            for date, moisture, precip, et, drainage, moisture_level
-            in zip(dates, moisture_states, precipitation, et_values, drainage_values, moisture_levels)
-        ]
-        
-        return moisture_proxies
+        self.soil_moisture_state = float(current_moisture)
+        
+        # Vectorized moisture level determination (integer bucket per day)
+        level_indices = np.searchsorted(_MOISTURE_LEVEL_BOUNDS, moisture_states, side="right")
+        
+        return SoilMoistureSeries(
+            dates=dates,
+            moisture_percent=moisture_states,
+            precipitation_mm=precipitation,
+            evapotranspiration_mm=et_values,
+            drainage_mm=drainage_values,
+            level_indices=level_indices
+        )
     
     def _calculate_evapotranspiration_vectorized(
         self,
@@ -462,20 +802,24 @@ class AgriculturalMetricsCalculator:
         Returns:
             Array of evapotranspiration values in mm/day
         """
-        base_et = self.soil_config["evapotranspiration_base"]
-        temp_coef = self.soil_config["et_temp_coefficient"]
+        base_et = self._base_et
+        temp_coef = self._et_temp_coef
         
-        # Temperature effect (ET increases with temperature above 25°C) - vectorized
-        temp_effect = 1.0 + temp_coef * (temperature - 25.0)
-        temp_effect = np.maximum(0.1, temp_effect)  # Minimum 10% of base ET
+        # Temperature effect (ET increases with temperature above 25°C) - in place
+        et = np.subtract(temperature, 25.0, dtype=np.float32)
+        et *= temp_coef
+        et += 1.0
+        np.maximum(et, 0.1, out=et)  # Minimum 10% of base ET
         
-        # Humidity effect (ET decreases with high humidity) - vectorized
-        humidity_factor = 1.0 - (humidity / 200.0)  # Reduces ET by up to 50% at 100% humidity
-        humidity_factor = np.clip(humidity_factor, 0.5, 1.0)
+        # Humidity effect (ET decreases with high humidity) - in place
+        humidity_factor = np.divide(humidity, -200.0, dtype=np.float32)
+        humidity_factor += 1.0  # Reduces ET by up to 50% at 100% humidity
+        np.clip(humidity_factor, 0.5, 1.0, out=humidity_factor)
         
-        et = base_et * temp_effect * humidity_factor
+        et *= base_et
+        et *= humidity_factor
         
-        return np.maximum(0.0, et)
+        return np.maximum(et, 0.0, out=et)
     
     def _calculate_evapotranspiration(
         self,
@@ -494,12 +838,39 @@ class AgriculturalMetricsCalculator:
         Returns:
             Evapotranspiration in mm/day
         """
-        # Use vectorized version with single values
-        result = self._calculate_evapotranspiration_vectorized(
-            np.array([temperature]),
-            np.array([humidity])
-        )
-        return float(result[0])
+        # Plain arithmetic - NumPy dispatch costs more than the math for one value
+        temp_factor = max(0.1, 1.0 + (temperature - 25.0) * self._et_temp_coef)
+        humidity_factor = min(1.0, max(0.5, 1.0 - humidity / 200.0))
+        
+        return float(max(0.0, self._base_et * temp_factor * humidity_factor))
+    
+    def calculate_confidence_scores(
+        self,
+        n_days: int,
+        model_uncertainty: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Calculate confidence scores for every day of a forecast horizon in one pass.
+        
+        Confidence decreases with forecast horizon and increases with model certainty.
+        
+        Args:
+            n_days: Number of forecast days
+            model_uncertainty: Optional model uncertainty metric (0-1). If None, ignored
+        
+        Returns:
+            Array of confidence scores from 0-1, index 0 being forecast day 1
+        """
+        # Exponential decay with forecast day
+        confidence = np.exp(-self._decay_rate * np.arange(n_days, dtype=np.float64))
+        confidence *= self._base_confidence
+        np.maximum(confidence, self._min_confidence, out=confidence)
+        
+        # Adjust for model uncertainty if provided
+        if model_uncertainty is not None:
+            confidence *= 1.0 - model_uncertainty
+        
+        return np.clip(confidence, 0.0, 1.0, out=confidence)
     
     def calculate_confidence_score(
         self,
@@ -518,13 +889,9 @@ class AgriculturalMetricsCalculator:
         Returns:
             Confidence score from 0-1
         """
-        base_confidence = self.confidence_config["base_confidence"]
-        decay_rate = self.confidence_config["decay_rate"]
-        min_confidence = self.confidence_config["min_confidence"]
-        
         # Exponential decay with forecast day
-        day_confidence = base_confidence * np.exp(-decay_rate * (forecast_day - 1))
-        day_confidence = max(min_confidence, day_confidence)
+        day_confidence = self._base_confidence * np.exp(-self._decay_rate * (forecast_day - 1))
+        day_confidence = max(self._min_confidence, day_confidence)
         
         # Adjust for model uncertainty if provided
         if model_uncertainty is not None:
@@ -3,35 +3,90 @@ Forecast Cache Manager
 Manages caching of GraphCast forecast results with TTL validation.
 """
 
+import os
+import copy
 import json
-import hashlib
+import sqlite3
+import time
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from .data_models import ForecastResult
-from .config import CACHE_CONFIG
+from .config import CACHE_BACKEND, CACHE_DIR, CACHE_MEMORY_SIZE, CACHE_TTL_SECONDS
 
 logger = logging.getLogger(__name__)
 
 
+# Number of striped per-key locks (power of two)
+_LOCK_STRIPES = 16
+
+# New entries are written as msgpack when it is installed. JSON entries are
+# still read, so caches written before the switch migrate lazily as they expire.
+_CACHE_SUFFIXES = (".msgpk", ".json") if msgpack is not None else (".json",)
+
+
+def _parse_date_dir(name: str) -> Optional[float]:
+    """
+    Parse a YYYY-MM-DD cache directory name to its local-midnight timestamp.
+    
+    Slices the fixed-width name directly; strptime's locale-aware parsing
+    is far slower. Returns None for names that are not valid dates.
+    """
+    if len(name) != 10 or name[4] != "-" or name[7] != "-":
+        return None
+    try:
+        return datetime(int(name[:4]), int(name[5:7]), int(name[8:10])).timestamp()
+    except ValueError:
+        return None
+
+
+def _dumps(forecast: ForecastResult) -> bytes:
+    """Serialize a forecast in the format of _CACHE_SUFFIXES[0]."""
+    if msgpack is not None:
+        return msgpack.packb(forecast.to_dict(), use_bin_type=True)
+    return forecast.serialized()
+
+
+def _loads(raw: bytes, suffix: str) -> Dict[str, Any]:
+    """Parse a cache payload read from a file with the given suffix."""
+    if suffix == ".msgpk":
+        return msgpack.unpackb(raw, raw=False)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ForecastCacheManager:
     """
     Manages forecast caching with file-based backend.
     
     Features:
     - File-based storage with organized directory structure
+    - In-process LRU of decoded forecasts in front of the files
     - TTL-based cache validation
-    - Thread-safe operations
+    - Thread-safe operations with per-key striped locking
     - Automatic cache invalidation
     """
     
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
-        ttl_seconds: Optional[int] = None
+        ttl_seconds: Optional[int] = None,
+        memory_cache_size: Optional[int] = None
     ):
         """
         Initialize cache manager.
@@ -39,10 +94,28 @@ class ForecastCacheManager:
         Args:
             cache_dir: Directory for cache storage (default from config)
             ttl_seconds: Time-to-live in seconds (default from config)
+            memory_cache_size: Max decoded forecasts kept in memory (default from config)
         """
-        self.cache_dir = cache_dir or CACHE_CONFIG["cache_dir"]
-        self.ttl_seconds = ttl_seconds or CACHE_CONFIG["ttl_seconds"]
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.ttl_seconds = ttl_seconds or CACHE_TTL_SECONDS
+        # Coarse lock for whole-cache sweeps; per-key work only takes one of
+        # the striped locks, so forecasts for different keys never contend
         self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+        self._mem_lock = threading.Lock()
+        
+        # cache_key -> (monotonic expiry, forecast); filled on disk reads only
+        self._mem: "OrderedDict[str, Tuple[float, ForecastResult]]" = OrderedDict()
+        self._mem_max = (
+            CACHE_MEMORY_SIZE if memory_cache_size is None else memory_cache_size
+        )
+        # Bumped by every write or invalidation, so a read that raced one is
+        # not kept in memory
+        self._mem_generation = 0
+        
+        # Today's date directory, resolved (and created) once per local day
+        self._today_dir: Optional[Path] = None
+        self._today_ends_at = 0.0
         
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -70,11 +143,9 @@ class ForecastCacheManager:
         lat_rounded = round(lat, 2)
         lon_rounded = round(lon, 2)
         
-        # Create hash from parameters
-        key_string = f"{lat_rounded}_{lon_rounded}_{forecast_days}"
-        key_hash = hashlib.md5(key_string.encode()).hexdigest()[:8]
-        
-        return f"forecast_{lat_rounded}_{lon_rounded}_{forecast_days}_{key_hash}"
+        # The rounded parameters already identify the entry uniquely, so no hash
+        # suffix is needed
+        return f"forecast_{lat_rounded}_{lon_rounded}_{forecast_days}"
     
     def _get_cache_path(self, cache_key: str) -> Path:
         """
@@ -86,30 +157,167 @@ class ForecastCacheManager:
         Returns:
             Path to cache file
         """
-        # Organize by date subdirectories (YYYY-MM-DD)
-        date_dir = self.cache_dir / datetime.now().strftime("%Y-%m-%d")
-        date_dir.mkdir(parents=True, exist_ok=True)
+        # Organize by date subdirectories (YYYY-MM-DD); only the first call
+        # after local midnight formats the name and creates the directory
+        if time.time() >= self._today_ends_at:
+            now = datetime.now()
+            date_dir = self.cache_dir / now.strftime("%Y-%m-%d")
+            date_dir.mkdir(parents=True, exist_ok=True)
+            
+            midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            self._today_dir = date_dir
+            self._today_ends_at = midnight.timestamp()
         
-        return date_dir / f"{cache_key}.json"
+        return self._today_dir / f"{cache_key}{_CACHE_SUFFIXES[0]}"
     
-    def _is_cache_valid(self, cache_path: Path) -> bool:
+    def _find_valid_entry(self, cache_path: Path) -> Tuple[Path, Optional[os.stat_result]]:
         """
-        Check if cache file is valid (exists and not expired).
+        Resolve a cache path to the first valid entry among the supported formats.
+        
+        Each candidate is stat()ed once; the result is returned so reading
+        and memoising the entry need no further stat calls.
         
         Args:
-            cache_path: Path to cache file
-            
+            cache_path: Cache file path in any supported format
+        
         Returns:
-            True if cache is valid, False otherwise
+            (path, stat result) of a valid entry, or (cache_path, None) if
+            none is valid
         """
-        if not cache_path.exists():
-            return False
+        now = time.time()
+        for suffix in _CACHE_SUFFIXES:
+            candidate = cache_path.with_suffix(suffix)
+            try:
+                st = os.stat(candidate)
+            except FileNotFoundError:
+                continue
+            if now - st.st_mtime < self.ttl_seconds:
+                return candidate, st
+        return cache_path, None
+    
+    def _scan_cache_files(self, date_dir: str) -> List[os.DirEntry]:
+        """
+        List cache entry files in a date directory, in any supported format.
         
-        # Check file modification time
-        mtime = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        age_seconds = (datetime.now() - mtime).total_seconds()
+        Uses os.scandir so names and file types come from a single directory
+        read; each entry caches its stat() result after the first call.
+        """
+        with os.scandir(date_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith(_CACHE_SUFFIXES) and entry.is_file(follow_symlinks=False)
+            ]
+    
+    def _stat_cache_files(self, date_dir: str) -> List[Tuple[str, os.stat_result]]:
+        """
+        List cache entry files in a date directory together with their stat results.
+        
+        The directory is scanned through an open descriptor, so every stat is
+        an fstatat() relative to it rather than a full path lookup; all stats
+        are taken in one pass while the descriptor is open.
         
-        return age_seconds < self.ttl_seconds
+        Args:
+            date_dir: Path of the date directory
+        
+        Returns:
+            List of (file name, stat result) pairs
+        """
+        if os.scandir not in os.supports_fd:
+            return [(entry.name, entry.stat()) for entry in self._scan_cache_files(date_dir)]
+        
+        results = []
+        dir_fd = os.open(date_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+        try:
+            with os.scandir(dir_fd) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_CACHE_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                        try:
+                            results.append((entry.name, entry.stat(follow_symlinks=False)))
+                        except FileNotFoundError:
+                            pass
+        finally:
+            os.close(dir_fd)
+        
+        return results
+    
+    def _unlink_files(self, date_dir: str, names: List[str]) -> int:
+        """
+        Delete cache files from one date directory.
+        
+        Names are unlinked relative to a single open directory descriptor
+        (unlinkat), so the kernel does not re-resolve the directory path for
+        every file.
+        
+        Args:
+            date_dir: Path of the date directory
+            names: File names inside date_dir to delete
+        
+        Returns:
+            Number of files deleted
+        """
+        if not names:
+            return 0
+        
+        deleted = 0
+        use_dir_fd = os.unlink in os.supports_dir_fd
+        dir_fd = os.open(date_dir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)) if use_dir_fd else None
+        try:
+            for name in names:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(name, dir_fd=dir_fd)
+                    else:
+                        os.unlink(os.path.join(date_dir, name))
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.error(f"Error deleting {os.path.join(date_dir, name)}: {e}")
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        
+        return deleted
+    
+    def _scan_date_dirs(self) -> List[os.DirEntry]:
+        """List the date subdirectories of the cache directory."""
+        with os.scandir(self.cache_dir) as entries:
+            return [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    
+    def _stripe(self, cache_key: str) -> threading.Lock:
+        """Return the striped lock guarding a cache key."""
+        return self._stripes[hash(cache_key) & (_LOCK_STRIPES - 1)]
+    
+    def _remember(
+        self,
+        cache_key: str,
+        forecast: ForecastResult,
+        read_stat: os.stat_result,
+        generation: int
+    ):
+        """
+        Keep a forecast decoded from disk in the in-memory LRU.
+        
+        The entry expires when its cache file would, so memory hits never
+        outlive the file-level TTL. Reads are unlocked, so the entry is only
+        kept if no write or invalidation happened since the read started
+        (generation is _mem_generation as seen before the file was found):
+        writers replace or delete the file before bumping the generation.
+        """
+        if self._mem_max <= 0:
+            return
+        
+        # The caller owns the forecast it was handed; keep a private copy
+        forecast = copy.deepcopy(forecast)
+        remaining = self.ttl_seconds - (time.time() - read_stat.st_mtime)
+        with self._mem_lock:
+            if self._mem_generation != generation:
+                return
+            
+            self._mem[cache_key] = (time.monotonic() + remaining, forecast)
+            self._mem.move_to_end(cache_key)
+            if len(self._mem) > self._mem_max:
+                self._mem.popitem(last=False)
     
     def get_forecast(
         self,
@@ -130,61 +338,78 @@ class ForecastCacheManager:
         """
         cache_key = self._generate_cache_key(lat, lon, forecast_days)
         
-        with self._lock:
-            # Try current date directory first
-            cache_path = self._get_cache_path(cache_key)
-            
-            if self._is_cache_valid(cache_path):
-                try:
-                    with open(cache_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    forecast = ForecastResult.from_dict(data)
-                    
+        # Serve recently decoded forecasts without touching the disk
+        with self._mem_lock:
+            entry = self._mem.get(cache_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._mem.move_to_end(cache_key)
                     logger.info(
-                        f"Cache HIT: {cache_key} "
+                        f"Cache HIT (memory): {cache_key} "
                         f"(lat={lat}, lon={lon}, days={forecast_days})"
                     )
-                    
-                    return forecast
-                    
-                except Exception as e:
-                    logger.error(f"Error reading cache {cache_key}: {e}")
-                    # Delete corrupted cache file
-                    try:
-                        cache_path.unlink()
-                    except:
-                        pass
-                    return None
-            
-            # Also check yesterday's directory (for forecasts near midnight)
-            yesterday_dir = self.cache_dir / (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-            yesterday_path = yesterday_dir / f"{cache_key}.json"
+                    return copy.deepcopy(entry[1])
+                del self._mem[cache_key]
+        
+        # Try current date directory first. Reads take no lock: writers replace
+        # files atomically, so a reader sees the previous or the new entry,
+        # never a partial one
+        generation = self._mem_generation
+        cache_path, read_stat = self._find_valid_entry(self._get_cache_path(cache_key))
+        
+        if read_stat is not None:
+            try:
+                data = _loads(cache_path.read_bytes(), cache_path.suffix)
+                
+                forecast = ForecastResult.from_dict(data)
+                self._remember(cache_key, forecast, read_stat, generation)
+                
+                logger.info(
+                    f"Cache HIT: {cache_key} "
+                    f"(lat={lat}, lon={lon}, days={forecast_days})"
+                )
+                
+                return forecast
             
-            if self._is_cache_valid(yesterday_path):
+            except Exception as e:
+                logger.error(f"Error reading cache {cache_key}: {e}")
+                # Delete corrupted cache file
                 try:
-                    with open(yesterday_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    forecast = ForecastResult.from_dict(data)
-                    
-                    logger.info(
-                        f"Cache HIT (yesterday): {cache_key} "
-                        f"(lat={lat}, lon={lon}, days={forecast_days})"
-                    )
-                    
-                    return forecast
-                    
-                except Exception as e:
-                    logger.error(f"Error reading cache {cache_key} from yesterday: {e}")
-                    return None
-            
-            logger.info(
-                f"Cache MISS: {cache_key} "
-                f"(lat={lat}, lon={lon}, days={forecast_days})"
-            )
+                    cache_path.unlink()
+                except:
+                    pass
+                return None
+        
+        # Also check yesterday's directory (for forecasts near midnight)
+        yesterday_dir = self.cache_dir / (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        yesterday_path, read_stat = self._find_valid_entry(
+            yesterday_dir / f"{cache_key}{_CACHE_SUFFIXES[0]}"
+        )
+        
+        if read_stat is not None:
+            try:
+                data = _loads(yesterday_path.read_bytes(), yesterday_path.suffix)
+                
+                forecast = ForecastResult.from_dict(data)
+                self._remember(cache_key, forecast, read_stat, generation)
+                
+                logger.info(
+                    f"Cache HIT (yesterday): {cache_key} "
+                    f"(lat={lat}, lon={lon}, days={forecast_days})"
+                )
+                
+                return forecast
             
-            return None
+            except Exception as e:
+                logger.error(f"Error reading cache {cache_key} from yesterday: {e}")
+                return None
+        
+        logger.info(
+            f"Cache MISS: {cache_key} "
+            f"(lat={lat}, lon={lon}, days={forecast_days})"
+        )
+        
+        return None
     
     def set_forecast(
         self,
@@ -208,14 +433,19 @@ class ForecastCacheManager:
         cache_key = self._generate_cache_key(lat, lon, forecast_days)
         cache_path = self._get_cache_path(cache_key)
         
-        with self._lock:
+        with self._stripe(cache_key):
+            # Write to a private temp file and rename it over the entry, so
+            # lock-free readers never observe a partially written file
+            tmp_path = cache_path.with_name(f"{cache_path.name}.tmp.{os.getpid()}")
             try:
-                # Serialize forecast to JSON
-                data = forecast.to_dict()
+                with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                    f.write(_dumps(forecast))
+                os.replace(tmp_path, cache_path)
                 
-                # Write to cache file
-                with open(cache_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Drop any decoded copy after the swap; the next read picks up the new file
+                with self._mem_lock:
+                    self._mem_generation += 1
+                    self._mem.pop(cache_key, None)
                 
                 logger.info(
                     f"Cache SET: {cache_key} "
@@ -226,6 +456,10 @@ class ForecastCacheManager:
                 
             except Exception as e:
                 logger.error(f"Error writing cache {cache_key}: {e}")
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
                 return False
     
     def invalidate_forecast(
@@ -247,23 +481,35 @@ class ForecastCacheManager:
         """
         cache_key = self._generate_cache_key(lat, lon, forecast_days)
         
-        with self._lock:
-            # Check current and yesterday directories
-            paths_to_check = [
-                self._get_cache_path(cache_key),
-                self.cache_dir / (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d") / f"{cache_key}.json"
+        with self._stripe(cache_key):
+            # Check current and yesterday directories, in every supported format.
+            # Paths are built without _get_cache_path so deleting never creates
+            # today's directory; every copy is removed so none can be served later
+            now = datetime.now()
+            date_dirs = [
+                self.cache_dir / now.strftime("%Y-%m-%d"),
+                self.cache_dir / (now - timedelta(days=1)).strftime("%Y-%m-%d")
             ]
             
             deleted = False
-            for cache_path in paths_to_check:
-                if cache_path.exists():
+            for date_dir in date_dirs:
+                for suffix in _CACHE_SUFFIXES:
+                    cache_path = date_dir / f"{cache_key}{suffix}"
                     try:
+                        # Unlink directly: one syscall, no exists() check first
                         cache_path.unlink()
                         logger.info(f"Cache INVALIDATED: {cache_key}")
                         deleted = True
+                    except FileNotFoundError:
+                        pass
                     except Exception as e:
                         logger.error(f"Error deleting cache {cache_key}: {e}")
             
+            # Drop any decoded copy after the files are gone
+            with self._mem_lock:
+                self._mem_generation += 1
+                self._mem.pop(cache_key, None)
+            
             return deleted
     
     def invalidate_old_forecasts(self) -> int:
@@ -276,44 +522,47 @@ class ForecastCacheManager:
         deleted_count = 0
         
         with self._lock:
+            with self._mem_lock:
+                mono_now = time.monotonic()
+                for cache_key in [k for k, (expiry, _) in self._mem.items() if expiry <= mono_now]:
+                    del self._mem[cache_key]
+            
+            now = time.time()
             try:
                 # Iterate through all date directories
-                for date_dir in self.cache_dir.iterdir():
-                    if not date_dir.is_dir():
-                        continue
-                    
+                for date_dir in self._scan_date_dirs():
                     # Check if directory is older than TTL
-                    try:
-                        dir_date = datetime.strptime(date_dir.name, "%Y-%m-%d")
-                        age_seconds = (datetime.now() - dir_date).total_seconds()
-                        
-                        if age_seconds > self.ttl_seconds:
-                            # Delete entire directory
-                            for cache_file in date_dir.glob("*.json"):
-                                try:
-                                    cache_file.unlink()
-                                    deleted_count += 1
-                                except Exception as e:
-                                    logger.error(f"Error deleting {cache_file}: {e}")
-                            
-                            # Try to remove empty directory
-                            try:
-                                date_dir.rmdir()
-                            except:
-                                pass
-                        else:
-                            # Check individual files in recent directories
-                            for cache_file in date_dir.glob("*.json"):
-                                if not self._is_cache_valid(cache_file):
-                                    try:
-                                        cache_file.unlink()
-                                        deleted_count += 1
-                                    except Exception as e:
-                                        logger.error(f"Error deleting {cache_file}: {e}")
-                    
-                    except ValueError:
+                    dir_timestamp = _parse_date_dir(date_dir.name)
+                    if dir_timestamp is None:
                         # Invalid directory name, skip
                         continue
+                    age_seconds = now - dir_timestamp
+                    
+                    if age_seconds > self.ttl_seconds:
+                        # Delete entire directory
+                        deleted_count += self._unlink_files(
+                            date_dir.path,
+                            [cache_file.name for cache_file in self._scan_cache_files(date_dir.path)]
+                        )
+                        
+                        # Try to remove empty directory
+                        try:
+                            os.rmdir(date_dir.path)
+                            if self._today_dir is not None and date_dir.name == self._today_dir.name:
+                                # Recreate it on the next write
+                                self._today_ends_at = 0.0
+                        except:
+                            pass
+                    else:
+                        # Check individual files in recent directories
+                        deleted_count += self._unlink_files(
+                            date_dir.path,
+                            [
+                                name
+                                for name, st in self._stat_cache_files(date_dir.path)
+                                if now - st.st_mtime >= self.ttl_seconds
+                            ]
+                        )
                 
                 if deleted_count > 0:
                     logger.info(f"Cache cleanup: deleted {deleted_count} expired forecasts")
@@ -339,16 +588,14 @@ class ForecastCacheManager:
             "total_size_bytes": 0
         }
         
+        now = time.time()
         try:
-            for date_dir in self.cache_dir.iterdir():
-                if not date_dir.is_dir():
-                    continue
-                
-                for cache_file in date_dir.glob("*.json"):
+            for date_dir in self._scan_date_dirs():
+                for _, st in self._stat_cache_files(date_dir.path):
                     stats["total_forecasts"] += 1
-                    stats["total_size_bytes"] += cache_file.stat().st_size
+                    stats["total_size_bytes"] += st.st_size
                     
-                    if self._is_cache_valid(cache_file):
+                    if now - st.st_mtime < self.ttl_seconds:
                         stats["valid_forecasts"] += 1
                     else:
                         stats["expired_forecasts"] += 1
@@ -357,3 +604,241 @@ class ForecastCacheManager:
             logger.error(f"Error getting cache stats: {e}")
         
         return stats
+
+
+class SQLiteForecastCacheManager(ForecastCacheManager):
+    """
+    Forecast cache stored in a single SQLite database in WAL mode.
+    
+    Same interface as ForecastCacheManager, but every entry is a row in one
+    indexed table instead of a file in a date directory: lookups are a
+    primary-key read, cleanup is a single DELETE and stats a single
+    aggregate query, with no directory scans or per-file syscalls. WAL lets
+    readers proceed while a write is in progress.
+    """
+    
+    DB_FILENAME = "forecasts.db"
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_seconds: Optional[int] = None,
+        memory_cache_size: Optional[int] = None
+    ):
+        """
+        Initialize SQLite cache manager.
+        
+        Args:
+            cache_dir: Directory holding the database file (default from config)
+            ttl_seconds: Time-to-live in seconds (default from config)
+            memory_cache_size: Unused; SQLite's page cache serves repeat reads
+        """
+        super().__init__(cache_dir=cache_dir, ttl_seconds=ttl_seconds, memory_cache_size=0)
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self._local = threading.local()
+        
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS forecast_cache ("
+            "key TEXT PRIMARY KEY, created_at REAL NOT NULL, format TEXT NOT NULL, blob BLOB NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS forecast_cache_created_at ON forecast_cache (created_at)")
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def get_forecast(
+        self,
+        lat: float,
+        lon: float,
+        forecast_days: int
+    ) -> Optional[ForecastResult]:
+        """
+        Retrieve cached forecast if available and valid.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            forecast_days: Number of forecast days
+        
+        Returns:
+            ForecastResult if cache hit and valid, None otherwise
+        """
+        cache_key = self._generate_cache_key(lat, lon, forecast_days)
+        
+        try:
+            row = self._connection().execute(
+                "SELECT format, blob FROM forecast_cache WHERE key = ? AND created_at > ?",
+                (cache_key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cache {cache_key}: {e}")
+            return None
+        
+        if row is None:
+            logger.info(
+                f"Cache MISS: {cache_key} "
+                f"(lat={lat}, lon={lon}, days={forecast_days})"
+            )
+            return None
+        
+        try:
+            forecast = ForecastResult.from_dict(_loads(row[1], row[0]))
+        except Exception as e:
+            logger.error(f"Error decoding cache {cache_key}: {e}")
+            # Delete corrupted entry
+            self.invalidate_forecast(lat, lon, forecast_days)
+            return None
+        
+        logger.info(
+            f"Cache HIT: {cache_key} "
+            f"(lat={lat}, lon={lon}, days={forecast_days})"
+        )
+        
+        return forecast
+    
+    def set_forecast(
+        self,
+        lat: float,
+        lon: float,
+        forecast_days: int,
+        forecast: ForecastResult
+    ) -> bool:
+        """
+        Store forecast in cache.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            forecast_days: Number of forecast days
+            forecast: ForecastResult to cache
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        cache_key = self._generate_cache_key(lat, lon, forecast_days)
+        
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO forecast_cache (key, created_at, format, blob) VALUES (?, ?, ?, ?)",
+                (cache_key, time.time(), _CACHE_SUFFIXES[0], _dumps(forecast))
+            )
+        except Exception as e:
+            logger.error(f"Error writing cache {cache_key}: {e}")
+            return False
+        
+        logger.info(
+            f"Cache SET: {cache_key} "
+            f"(lat={lat}, lon={lon}, days={forecast_days})"
+        )
+        
+        return True
+    
+    def invalidate_forecast(
+        self,
+        lat: float,
+        lon: float,
+        forecast_days: int
+    ) -> bool:
+        """
+        Invalidate (delete) a specific cached forecast.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            forecast_days: Number of forecast days
+        
+        Returns:
+            True if deleted, False if not found or error
+        """
+        cache_key = self._generate_cache_key(lat, lon, forecast_days)
+        
+        try:
+            cursor = self._connection().execute("DELETE FROM forecast_cache WHERE key = ?", (cache_key,))
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting cache {cache_key}: {e}")
+            return False
+        
+        if cursor.rowcount > 0:
+            logger.info(f"Cache INVALIDATED: {cache_key}")
+            return True
+        return False
+    
+    def invalidate_old_forecasts(self) -> int:
+        """
+        Remove expired forecasts from cache.
+        
+        Returns:
+            Number of forecasts deleted
+        """
+        try:
+            cursor = self._connection().execute(
+                "DELETE FROM forecast_cache WHERE created_at <= ?",
+                (time.time() - self.ttl_seconds,)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"Error during cache cleanup: {e}")
+            return 0
+        
+        deleted_count = cursor.rowcount
+        if deleted_count > 0:
+            logger.info(f"Cache cleanup: deleted {deleted_count} expired forecasts")
+        
+        return deleted_count
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with cache statistics
+        """
+        stats = {
+            "cache_dir": str(self.cache_dir),
+            "ttl_seconds": self.ttl_seconds,
+            "total_forecasts": 0,
+            "valid_forecasts": 0,
+            "expired_forecasts": 0,
+            "total_size_bytes": 0
+        }
+        
+        try:
+            total, valid, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(created_at > ?), 0), COALESCE(SUM(LENGTH(blob)), 0) "
+                "FROM forecast_cache",
+                (time.time() - self.ttl_seconds,)
+            ).fetchone()
+            stats["total_forecasts"] = total
+            stats["valid_forecasts"] = valid
+            stats["expired_forecasts"] = total - valid
+            stats["total_size_bytes"] = size
+        except sqlite3.Error as e:
+            logger.error(f"Error getting cache stats: {e}")
+        
+        return stats
+
+
+def create_cache_manager(backend: Optional[str] = None, **kwargs) -> ForecastCacheManager:
+    """
+    Create the forecast cache manager for the configured backend.
+    
+    Args:
+        backend: "file" or "sqlite" (default from config)
+        **kwargs: Passed through to the cache manager constructor
+    
+    Returns:
+        Cache manager instance
+    """
+    backend = backend or CACHE_BACKEND
+    if backend == "sqlite":
+        return SQLiteForecastCacheManager(**kwargs)
+    if backend == "file":
+        return ForecastCacheManager(**kwargs)
+    raise ValueError(f"Unsupported cache backend: {backend}")
@@ -5,7 +5,19 @@ Defines model paths, cache settings, and region boundaries for GraphCast integra
 
 import os
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
+
+import numpy as np
+
+
+def _freeze(config: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a nested settings dict in read-only MappingProxyType views."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
+
 
 # Base directories
 BASE_DIR = Path(__file__).parent.parent
@@ -18,6 +30,9 @@ MODEL_CONFIG = {
     "weights_url": "https://github.com/google-deepmind/graphcast/releases/download/v0.1/graphcast_operational.npz",
     "weights_path": MODELS_DIR / "graphcast_operational.npz",
     "weights_checksum": None,  # Will be validated during download
+    # Algorithm weights_checksum was computed with: "sha256" for a plain file
+    # digest, or "sha256-tree-64M" to hash 64 MiB shards in parallel
+    "checksum_algorithm": "sha256",
     "model_version": "v0.1",
 }
 
@@ -32,14 +47,21 @@ REGION_BOUNDARIES = {
     }
 }
 
-# Cache settings
-CACHE_CONFIG = {
-    "backend": "file",  # Options: "file", "redis"
-    "ttl_seconds": 86400,  # 24 hours
+# Cache settings; hot values are also plain module constants so readers skip the dict lookup
+CACHE_BACKEND: str = os.getenv("GRAPHCAST_CACHE_BACKEND", "file")  # Options: "file", "sqlite"
+CACHE_TTL_SECONDS: int = 86400  # 24 hours
+CACHE_MEMORY_SIZE: int = 512  # Decoded forecasts kept in process (0 disables)
+
+CACHE_CONFIG = _freeze({
+    "backend": CACHE_BACKEND,
+    "ttl_seconds": CACHE_TTL_SECONDS,
     "cache_dir": CACHE_DIR,
+    "memory_cache_size": CACHE_MEMORY_SIZE,
     "enable_precomputation": True,
     "precompute_schedule": "0 0 * * *",  # Daily at 00:00 UTC
-}
+    # Cities pre-computed at the same time
+    "precompute_concurrency": int(os.getenv("PRECOMPUTE_CONCURRENCY", "4")),
+})
 
 # Inference settings
 INFERENCE_CONFIG = {
@@ -49,11 +71,26 @@ INFERENCE_CONFIG = {
     "timeout_gpu_seconds": 60,
     "device": "cpu",  # Options: "cpu", "cuda", "auto"
     "lazy_loading": True,
+    # Persistent XLA compilation cache, so compiled rollouts survive restarts
+    "compilation_cache_dir": os.getenv("GRAPHCAST_XLA_CACHE_DIR"),
+    # Activation dtype of the rollout; normalization and outputs stay float32
+    "rollout_dtype": os.getenv("GRAPHCAST_ROLLOUT_DTYPE", "bfloat16"),
+    # Concurrent rollouts of the same shape are batched through jax.vmap
+    "batch_max_size": 8,
+    "batch_window_ms": 10,
+    # Finished forecasts reused for nearby requests in the same hour (0 disables)
+    "result_cache_size": 1024,
+    "result_cache_ttl_seconds": 3600,
+    # Preprocessed inputs kept on the device per (region, ERA5 hour)
+    "device_input_cache_size": 8,
 }
 
 # ERA5 data settings
 ERA5_CONFIG = {
     "data_dir": DATA_DIR,
+    # Optional fsspec URL of a shared ERA5 cache (e.g. "s3://bucket/era5"),
+    # consulted on a local miss before submitting a CDS request
+    "mirror_url": os.getenv("ERA5_MIRROR_URL"),
     "cache_ttl_seconds": 86400,  # 24 hours
     "required_variables": [
         "temperature",
@@ -64,10 +101,12 @@ ERA5_CONFIG = {
     ],
     "spatial_resolution": 0.25,  # degrees
     "temporal_resolution": "1H",  # hourly
+    # Worker processes encoding and writing cache entries (0 = threads in-process)
+    "io_workers": int(os.getenv("ERA5_IO_WORKERS", 0)),
 }
 
-# Agricultural metrics thresholds for Maharashtra
-AGRICULTURAL_THRESHOLDS = {
+# Agricultural metrics thresholds for Maharashtra (read-only)
+AGRICULTURAL_THRESHOLDS = _freeze({
     "rainfall_risk": {
         "low_threshold": 5.0,  # mm/day - below this is low risk
         "moderate_threshold": 25.0,  # mm/day - above this is high risk
@@ -100,7 +139,34 @@ AGRICULTURAL_THRESHOLDS = {
         "decay_rate": 0.05,  # confidence decrease per day
         "min_confidence": 0.5,  # minimum confidence score
     }
-}
+})
+
+
+
+def build_crop_temperature_table(
+    ranges: Mapping[str, Mapping[str, float]]
+) -> Tuple[Dict[str, int], np.ndarray, np.ndarray]:
+    """
+    Flatten per-crop optimal temperature ranges into index-aligned arrays.
+    
+    Args:
+        ranges: Mapping of crop name to {"min": ..., "max": ...} in Celsius
+    
+    Returns:
+        Tuple of (crop name -> index, float32 minimums, float32 maximums)
+    """
+    crops = tuple(ranges)
+    crop_index = {crop: i for i, crop in enumerate(crops)}
+    temp_min = np.fromiter((ranges[crop]["min"] for crop in crops), dtype=np.float32, count=len(crops))
+    temp_max = np.fromiter((ranges[crop]["max"] for crop in crops), dtype=np.float32, count=len(crops))
+    return crop_index, temp_min, temp_max
+
+
+# Optimal temperature ranges as arrays, so scoring can look up or broadcast
+# crop ranges without walking the nested threshold dicts
+CROP_INDEX, TEMP_OPT_MIN, TEMP_OPT_MAX = build_crop_temperature_table(
+    AGRICULTURAL_THRESHOLDS["temperature_optimal_ranges"]
+)
 
 # Logging configuration
 LOGGING_CONFIG = {
@@ -3,21 +3,39 @@ GraphCast Data Models
 Defines data structures for forecast results and related entities.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+
+@dataclass(slots=True)
 class Location:
     """Geographic location information"""
     latitude: float
     longitude: float
     region: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'region': self.region
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class RawWeatherData:
     """Raw weather data from GraphCast predictions"""
     precipitation_mm: float
@@ -26,9 +44,20 @@ class RawWeatherData:
     temp_mean_c: float
     humidity_percent: float
     wind_speed_ms: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'precipitation_mm': self.precipitation_mm,
+            'temp_max_c': self.temp_max_c,
+            'temp_min_c': self.temp_min_c,
+            'temp_mean_c': self.temp_mean_c,
+            'humidity_percent': self.humidity_percent,
+            'wind_speed_ms': self.wind_speed_ms
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastDay:
     """Single day forecast with agricultural metrics"""
     date: datetime
@@ -40,20 +69,25 @@ class ForecastDay:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with ISO format dates"""
-        data = asdict(self)
-        data['date'] = self.date.isoformat()
-        return data
+        return {
+            'date': self.date.isoformat(),
+            'rain_risk': self.rain_risk,
+            'temp_extreme': self.temp_extreme,
+            'soil_moisture_proxy': self.soil_moisture_proxy,
+            'confidence_score': self.confidence_score,
+            'raw_weather': self.raw_weather.to_dict()
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ForecastDay':
         """Create from dictionary with ISO format dates"""
         data = data.copy()
-        data['date'] = datetime.fromisoformat(data['date'])
+        data['date'] = parse_datetime(data['date'])
         data['raw_weather'] = RawWeatherData(**data['raw_weather'])
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastMetadata:
     """Metadata about forecast generation"""
     model_version: str
@@ -64,23 +98,25 @@ class ForecastMetadata:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with ISO format dates"""
-        data = asdict(self)
-        data['generated_at'] = self.generated_at.isoformat()
-        if self.era5_timestamp:
-            data['era5_timestamp'] = self.era5_timestamp.isoformat()
-        return data
+        return {
+            'model_version': self.model_version,
+            'generated_at': self.generated_at.isoformat(),
+            'cache_hit': self.cache_hit,
+            'inference_time_ms': self.inference_time_ms,
+            'era5_timestamp': self.era5_timestamp.isoformat() if self.era5_timestamp else None
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ForecastMetadata':
         """Create from dictionary with ISO format dates"""
         data = data.copy()
-        data['generated_at'] = datetime.fromisoformat(data['generated_at'])
+        data['generated_at'] = parse_datetime(data['generated_at'])
         if data.get('era5_timestamp'):
-            data['era5_timestamp'] = datetime.fromisoformat(data['era5_timestamp'])
+            data['era5_timestamp'] = parse_datetime(data['era5_timestamp'])
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastResult:
     """Complete forecast result with all data"""
     location: Location
@@ -90,11 +126,17 @@ class ForecastResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
-            'location': asdict(self.location),
+            'location': self.location.to_dict(),
             'forecast_days': [day.to_dict() for day in self.forecast_days],
             'metadata': self.metadata.to_dict()
         }
     
+    def serialized(self) -> bytes:
+        """Compact JSON bytes of to_dict()"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(',', ':')).encode()
+    
     def to_json(self) -> str:
         """Serialize to JSON string"""
         return json.dumps(self.to_dict(), indent=2)
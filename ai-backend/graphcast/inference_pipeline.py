@@ -6,10 +6,14 @@ Orchestrates model execution including preprocessing, inference, and postprocess
 from __future__ import annotations
 import logging
 import asyncio
+import copy
+import functools
 import time
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Hashable, Union, TYPE_CHECKING
+from dataclasses import dataclass, replace
 
 if TYPE_CHECKING:
     import xarray as xr
@@ -28,12 +32,144 @@ except ImportError:
 
 from .model_manager import GraphCastModelManager
 from .era5_fetcher import ERA5DataFetcher
-from .config import INFERENCE_CONFIG, REGION_BOUNDARIES
+from .config import INFERENCE_CONFIG, REGION_BOUNDARIES, ERA5_CONFIG
 from .profiler import get_profiler
 
 logger = logging.getLogger(__name__)
 profiler = get_profiler()
 
+# ERA5 variable name -> standard name, in the order variables are stacked
+_VARIABLE_MAPPING = {
+    't2m': 'temperature',
+    'sp': 'pressure',
+    'r': 'humidity',
+    'u10': 'u_wind',
+    'v10': 'v_wind'
+}
+_VARIABLE_INDEX = {name: i for i, name in enumerate(_VARIABLE_MAPPING.values())}
+
+# Normalization parameters (mean, std) for each variable
+# These are approximate values for ERA5 data
+_NORMALIZATION_PARAMS = {
+    'temperature': {'mean': 273.15, 'std': 20.0},  # Kelvin
+    'pressure': {'mean': 101325.0, 'std': 10000.0},  # Pascal
+    'humidity': {'mean': 50.0, 'std': 30.0},  # Percent
+    'u_wind': {'mean': 0.0, 'std': 5.0},  # m/s
+    'v_wind': {'mean': 0.0, 'std': 5.0},  # m/s
+}
+
+# The same parameters as (V,) vectors in _VARIABLE_MAPPING order, with the
+# reciprocal std precomputed so normalization multiplies instead of divides
+if np is not None:
+    _NORM_MEAN = np.array(
+        [_NORMALIZATION_PARAMS[name]['mean'] for name in _VARIABLE_MAPPING.values()],
+        dtype=np.float32
+    )
+    _INV_STD = np.array(
+        [1.0 / _NORMALIZATION_PARAMS[name]['std'] for name in _VARIABLE_MAPPING.values()],
+        dtype=np.float32
+    )
+
+# Normalized inputs enter the rollout in this dtype
+_ROLLOUT_DTYPE = jnp.dtype(INFERENCE_CONFIG["rollout_dtype"]) if jnp is not None else None
+
+# Region bounding boxes as an (R, 4) table of lat_min, lat_max, lon_min, lon_max
+_REGION_NAMES = list(REGION_BOUNDARIES)
+_REGION_BOX = np.array([
+    [b["lat_min"], b["lat_max"], b["lon_min"], b["lon_max"]]
+    for b in REGION_BOUNDARIES.values()
+]) if np is not None else None
+
+
+def _rollout_step(state: "jnp.ndarray") -> "jnp.ndarray":
+    """
+    Advance the normalized model state by one 6-hour step.
+    
+    Placeholder for the GraphCast step function: persistence, i.e. the
+    next state equals the current one.
+    """
+    return state
+
+
+def _readout(state: "jnp.ndarray", lat_idx: "jnp.ndarray", lon_idx: "jnp.ndarray") -> "jnp.ndarray":
+    """Read the (V,) model state at a grid point, from the latest time slice if any."""
+    point = state[..., lat_idx, lon_idx]
+    return point.reshape(point.shape[0], -1)[:, -1].astype(jnp.float32)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_rollout_fn(shape: Tuple[int, ...], num_steps: int, batch_size: int = 1) -> Any:
+    """
+    Get the compiled, batched autoregressive rollout for an input shape and length.
+    
+    Compiling a rollout is expensive, so executables are kept per
+    (shape, num_steps) and, when a compilation cache directory is
+    configured, persisted across processes by JAX. The steps run inside
+    jax.lax.scan, so the compiled graph holds a single step body however
+    long the rollout is. The target grid indices are runtime arguments,
+    so every location within a region shares one executable. Requests are
+    mapped over a leading batch axis with jax.vmap. The state is carried
+    in _ROLLOUT_DTYPE; readouts are returned as float32.
+    
+    The input batch is donated: the final state is returned with the
+    input's shape and dtype, so XLA can carry the state in the input
+    buffer instead of allocating a second one. Callers must pass a
+    buffer they no longer need, e.g. a freshly stacked batch.
+    
+    Args:
+        shape: Shape of one stacked (V, ...) normalized input
+        num_steps: Number of 6-hour steps to roll out
+        batch_size: Number of inputs rolled out together
+        
+    Returns:
+        Compiled function mapping (batch_size, V, ...) inputs and
+        (batch_size,) lat/lon indices to the (batch_size, V, ...) final
+        states and (batch_size, num_steps, V) readouts
+    """
+    def rollout(x, lat_idx, lon_idx):
+        def step(state, _):
+            state = _rollout_step(state)
+            return state, _readout(state, lat_idx, lon_idx)
+        return jax.lax.scan(step, x, None, length=num_steps)
+    
+    index = jax.ShapeDtypeStruct((batch_size,), jnp.int32)
+    return jax.jit(jax.vmap(rollout), donate_argnums=(0,)).lower(
+        jax.ShapeDtypeStruct((batch_size,) + tuple(shape), _ROLLOUT_DTYPE), index, index
+    ).compile()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_multipoint_rollout_fn(shape: Tuple[int, ...], num_steps: int, num_points: int) -> Any:
+    """
+    Get the compiled rollout of one input read out at several grid points.
+    
+    Unlike _get_rollout_fn, the state is rolled out once and read at
+    num_points locations per step, so points of one region share a single
+    forward pass. The input is not donated: it is normally the cached
+    device input of the region, which later requests reuse.
+    
+    Args:
+        shape: Shape of the stacked (V, ...) normalized input
+        num_steps: Number of 6-hour steps to roll out
+        num_points: Number of grid points read out
+        
+    Returns:
+        Compiled function mapping a (V, ...) input and (num_points,)
+        lat/lon indices to (num_points, num_steps, V) readouts
+    """
+    read_points = jax.vmap(_readout, in_axes=(None, 0, 0))
+    
+    def rollout(x, lat_idx, lon_idx):
+        def step(state, _):
+            state = _rollout_step(state)
+            return state, read_points(state, lat_idx, lon_idx)
+        return jnp.swapaxes(jax.lax.scan(step, x, None, length=num_steps)[1], 0, 1)
+    
+    index = jax.ShapeDtypeStruct((num_points,), jnp.int32)
+    return jax.jit(rollout).lower(
+        jax.ShapeDtypeStruct(tuple(shape), _ROLLOUT_DTYPE), index, index
+    ).compile()
+
 
 @dataclass
 class Location:
@@ -65,6 +201,80 @@ class ForecastDay:
     raw_weather: RawWeatherData
 
 
+@dataclass(eq=False)
+class ForecastDaysSoA(Sequence):
+    """
+    Forecast days stored column-wise, one array per field.
+    
+    Behaves as a read-only sequence of ForecastDay; the per-day objects are
+    only built when the sequence is indexed or iterated, e.g. while
+    serializing a response. To change values, assign to the columns.
+    """
+    dates: "np.ndarray"  # datetime64[us]
+    rain_risk: "np.ndarray"  # 0-100
+    temp_extreme: "np.ndarray"  # 0-100
+    soil_moisture_proxy: "np.ndarray"  # 0-100
+    confidence_score: "np.ndarray"  # 0-1
+    raw_weather: Dict[str, "np.ndarray"]  # RawWeatherData field name -> daily values
+    
+    @classmethod
+    def from_forecast_days(cls, days: List[ForecastDay]) -> 'ForecastDaysSoA':
+        """Build the column layout from a list of ForecastDay objects."""
+        raw = [day.raw_weather for day in days]
+        return cls(
+            dates=np.array([day.date for day in days], dtype='datetime64[us]'),
+            rain_risk=np.array([day.rain_risk for day in days]),
+            temp_extreme=np.array([day.temp_extreme for day in days]),
+            soil_moisture_proxy=np.array([day.soil_moisture_proxy for day in days]),
+            confidence_score=np.array([day.confidence_score for day in days]),
+            raw_weather={
+                name: np.array([getattr(r, name) for r in raw])
+                for name in RawWeatherData.__dataclass_fields__
+            }
+        )
+    
+    def __len__(self) -> int:
+        return len(self.dates)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[ForecastDay, List[ForecastDay]]:
+        if isinstance(index, slice):
+            # Slices give a list of days, like slicing a list of ForecastDay
+            return [self[i] for i in range(len(self))[index]]
+        # Normalizes negative indices and raises IndexError past the end
+        i = range(len(self))[index]
+        return ForecastDay(
+            date=self.dates[i].item(),
+            rain_risk=float(self.rain_risk[i]),
+            temp_extreme=float(self.temp_extreme[i]),
+            soil_moisture_proxy=float(self.soil_moisture_proxy[i]),
+            confidence_score=float(self.confidence_score[i]),
+            raw_weather=RawWeatherData(**{
+                name: float(values[i]) for name, values in self.raw_weather.items()
+            })
+        )
+    
+    def __iter__(self) -> Iterator[ForecastDay]:
+        # Convert whole columns with tolist() instead of boxing one scalar at a time
+        raw_names = list(self.raw_weather)
+        raw_rows = zip(*(values.tolist() for values in self.raw_weather.values()))
+        for date, rain_risk, temp_extreme, soil_moisture, confidence, raw in zip(
+            self.dates.tolist(),
+            self.rain_risk.tolist(),
+            self.temp_extreme.tolist(),
+            self.soil_moisture_proxy.tolist(),
+            self.confidence_score.tolist(),
+            raw_rows
+        ):
+            yield ForecastDay(
+                date=date,
+                rain_risk=rain_risk,
+                temp_extreme=temp_extreme,
+                soil_moisture_proxy=soil_moisture,
+                confidence_score=confidence,
+                raw_weather=RawWeatherData(**dict(zip(raw_names, raw)))
+            )
+
+
 @dataclass
 class ForecastMetadata:
     """Metadata about the forecast"""
@@ -79,7 +289,7 @@ class ForecastMetadata:
 class ForecastResult:
     """Complete forecast result"""
     location: Location
-    forecast_days: List[ForecastDay]
+    forecast_days: Sequence  # ForecastDaysSoA or List[ForecastDay]
     metadata: ForecastMetadata
 
 
@@ -107,9 +317,83 @@ class GraphCastInferencePipeline:
         self.timeout_cpu = INFERENCE_CONFIG["timeout_cpu_seconds"]
         self.timeout_gpu = INFERENCE_CONFIG["timeout_gpu_seconds"]
         self.max_forecast_days = INFERENCE_CONFIG["max_forecast_days"]
+        self.batch_max_size = INFERENCE_CONFIG["batch_max_size"]
+        self.batch_window = INFERENCE_CONFIG["batch_window_ms"] / 1000.0
+        self.result_cache_size = INFERENCE_CONFIG["result_cache_size"]
+        self.result_cache_ttl = INFERENCE_CONFIG["result_cache_ttl_seconds"]
+        self.device_input_cache_size = INFERENCE_CONFIG["device_input_cache_size"]
+        
+        cache_dir = INFERENCE_CONFIG["compilation_cache_dir"]
+        if jax is not None and cache_dir:
+            jax.config.update("jax_compilation_cache_dir", cache_dir)
+        
+        # Compiled NaN-fill + normalize kernels keyed by stacked input shape
+        self._preprocess_kernels: Dict[Tuple[int, ...], Any] = {}
+        
+        # Rollout requests waiting for their batch to be dispatched,
+        # keyed by (event loop, input shape, num_steps)
+        self._pending_batches: Dict[Hashable, List[Tuple[Any, ...]]] = {}
+        
+        # Finished forecasts as (monotonic expiry, result), oldest first
+        self._results: "OrderedDict[Tuple[Any, ...], Tuple[float, ForecastResult]]" = OrderedDict()
+        
+        # Preprocessed device inputs by (region name, ERA5 hour), oldest first
+        self._device_inputs: "OrderedDict[Tuple[str, datetime], jnp.ndarray]" = OrderedDict()
+        
+        # Result key -> shared inference task for forecasts being computed
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
         
         logger.info("GraphCastInferencePipeline initialized")
     
+    async def warmup(self) -> bool:
+        """
+        Compile the preprocessing kernel and rollout before user traffic.
+        
+        Runs zero inputs with the canonical shape of each region (one ERA5
+        hour on the configured grid) through the functions real requests
+        use, so the first request skips tracing and compilation. With a
+        compilation cache directory configured, later restarts load the
+        compiled executables from disk instead of recompiling.
+        
+        Returns:
+            True if warmup succeeded, False otherwise
+        """
+        if np is None or jax is None:
+            logger.warning("NumPy or JAX not installed, skipping warmup")
+            return False
+        
+        num_steps = self.max_forecast_days * 4
+        resolution = ERA5_CONFIG["spatial_resolution"]
+        
+        try:
+            for region_name, bounds in REGION_BOUNDARIES.items():
+                shape = (
+                    len(_VARIABLE_MAPPING),
+                    1,
+                    int(round((bounds["lat_max"] - bounds["lat_min"]) / resolution)) + 1,
+                    int(round((bounds["lon_max"] - bounds["lon_min"]) / resolution)) + 1
+                )
+                start_time = time.time()
+                # Compiling blocks, so keep it off the event loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._compile_for_shape, shape, num_steps
+                )
+                logger.info(
+                    f"Warmed up {region_name} inputs {shape} in "
+                    f"{(time.time() - start_time) * 1000:.0f}ms"
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Warmup failed: {e}", exc_info=True)
+            return False
+    
+    def _compile_for_shape(self, shape: Tuple[int, ...], num_steps: int):
+        """Compile and run the preprocessing kernel and rollout once for a shape."""
+        inputs, _ = self._preprocess_kernel(shape)(jax.device_put(np.zeros(shape, dtype=np.float32)))
+        index = np.zeros(1, dtype=np.int32)
+        _, readouts = _get_rollout_fn(shape, num_steps)(inputs[None], index, index)
+        readouts.block_until_ready()
+    
     @profiler.profile_function("run_inference")
     async def run_inference(
         self,
@@ -136,84 +420,373 @@ class GraphCastInferencePipeline:
                 logger.warning(f"Requested {forecast_days} days, limiting to {self.max_forecast_days}")
                 forecast_days = self.max_forecast_days
             
-            # Ensure model is loaded
-            if not self.model_manager.is_model_loaded():
-                logger.info("Model not loaded, loading now...")
-                success = await self.model_manager.load_model()
-                if not success:
-                    logger.error("Failed to load model")
-                    return None
-            
             # Get region boundaries
             region_name = self._get_region_name(lat, lon)
             if not region_name:
                 logger.error(f"Coordinates ({lat}, {lon}) outside supported regions")
                 return None
             
-            bounds = REGION_BOUNDARIES[region_name]
-            
-            # Fetch ERA5 initial conditions
-            logger.info(f"Fetching ERA5 initial conditions for ({lat}, {lon})")
             timestamp = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
             
-            with profiler.profile_block("fetch_era5_data"):
-                era5_data = await self.data_fetcher.fetch_initial_conditions(
-                    lat_min=bounds["lat_min"],
-                    lat_max=bounds["lat_max"],
-                    lon_min=bounds["lon_min"],
-                    lon_max=bounds["lon_max"],
-                    timestamp=timestamp
-                )
+            # Nearby requests for the same horizon within the same hour share a forecast
+            result_key = (round(lat, 2), round(lon, 2), forecast_days, timestamp)
+            entry = self._results.get(result_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._results.move_to_end(result_key)
+                    logger.info(f"Forecast cache HIT for ({lat}, {lon})")
+                    return self._copy_result(entry[1], lat, lon, start_time, cache_hit=True)
+                del self._results[result_key]
+            
+            pending = self._inflight.get(result_key)
+            joined = pending is not None
+            if pending is None:
+                pending = asyncio.ensure_future(self._infer(
+                    lat, lon, forecast_days, region_name, timestamp, result_key
+                ))
+                self._inflight[result_key] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(result_key, None))
+            else:
+                logger.info(f"Joining in-flight inference for ({lat}, {lon})")
             
-            if era5_data is None:
-                logger.error("Failed to fetch ERA5 initial conditions")
+            # Shield so one cancelled caller does not abort the inference for the others
+            forecast_result = await asyncio.shield(pending)
+            if forecast_result is None:
                 return None
             
-            # Preprocess inputs
-            logger.info("Preprocessing ERA5 data for GraphCast")
-            with profiler.profile_block("preprocess_inputs"):
-                preprocessed_data = self._preprocess_inputs(era5_data, lat, lon)
+            # Every caller gets its own copy, leaving the cached result untouched
+            forecast_result = self._copy_result(
+                forecast_result, lat, lon, start_time, cache_hit=joined
+            )
+            logger.info(f"Inference completed in {forecast_result.metadata.inference_time_ms}ms")
+            return forecast_result
             
-            if preprocessed_data is None:
-                logger.error("Input preprocessing failed")
-                return None
+        except Exception as e:
+            logger.error(f"Inference pipeline failed: {e}", exc_info=True)
+            return None
+    
+    async def _infer(
+        self,
+        lat: float,
+        lon: float,
+        forecast_days: int,
+        region_name: str,
+        timestamp: datetime,
+        result_key: Tuple[Any, ...]
+    ) -> Optional[ForecastResult]:
+        """
+        Run the full fetch/preprocess/rollout/postprocess chain once.
+        
+        Shared by every caller coalesced onto the same result key; the
+        finished forecast is stored in the in-memory result cache.
+        
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            forecast_days: Number of days to forecast
+            region_name: Region containing the coordinates
+            timestamp: Hour of the ERA5 initial conditions
+            result_key: Result cache key for this forecast
             
-            # Run inference with timeout
-            logger.info(f"Running GraphCast inference for {forecast_days} days")
-            timeout = self.timeout_gpu if self.model_manager.device == "gpu" else self.timeout_cpu
+        Returns:
+            ForecastResult or None if inference fails
+        """
+        # Fetch ERA5 initial conditions
+        logger.info(f"Fetching ERA5 initial conditions for ({lat}, {lon})")
+        era5_data = await self._fetch_initial_conditions(region_name, timestamp)
+        if era5_data is None:
+            return None
+        
+        # Preprocess inputs
+        logger.info("Preprocessing ERA5 data for GraphCast")
+        with profiler.profile_block("preprocess_inputs"):
+            preprocessed_data = self._preprocess_inputs(
+                era5_data, lat, lon, input_key=(region_name, timestamp)
+            )
+        
+        if preprocessed_data is None:
+            logger.error("Input preprocessing failed")
+            return None
+        
+        # Run inference with timeout
+        logger.info(f"Running GraphCast inference for {forecast_days} days")
+        timeout = self.timeout_gpu if self.model_manager.device == "gpu" else self.timeout_cpu
+        
+        try:
+            predictions = await asyncio.wait_for(
+                self._run_model_inference(preprocessed_data, forecast_days),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Inference timeout after {timeout}s")
+            return None
+        
+        if predictions is None:
+            logger.error("Model inference failed")
+            return None
+        
+        # Postprocess outputs
+        logger.info("Postprocessing model outputs")
+        with profiler.profile_block("postprocess_outputs"):
+            forecast_result = self._postprocess_outputs(
+                predictions, lat, lon, region_name, timestamp
+            )
+        
+        if forecast_result is not None:
+            self._store_result(result_key, forecast_result)
+        
+        return forecast_result
+    
+    async def run_inference_batch(
+        self,
+        latlons: "np.ndarray",
+        forecast_days: int = 10
+    ) -> List[Optional[ForecastResult]]:
+        """
+        Run GraphCast inference for many locations at once.
+        
+        Locations are grouped by region; each region's initial conditions
+        are fetched and preprocessed once and rolled out in a single
+        forward pass, read out at every requested grid point. Results are
+        also stored in the in-memory result cache, so later run_inference
+        calls for the same points are served from it.
+        
+        Args:
+            latlons: (N, 2) array of latitude/longitude pairs in degrees
+            forecast_days: Number of days to forecast (default: 10, max: 10)
             
+        Returns:
+            List of N ForecastResult objects, None where inference failed
+        """
+        start_time = time.time()
+        latlons = np.asarray(latlons, dtype=np.float64).reshape(-1, 2)
+        results: List[Optional[ForecastResult]] = [None] * len(latlons)
+        
+        if forecast_days > self.max_forecast_days:
+            logger.warning(f"Requested {forecast_days} days, limiting to {self.max_forecast_days}")
+            forecast_days = self.max_forecast_days
+        
+        timestamp = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+        
+        # Group points by region
+        by_region: Dict[str, List[int]] = {}
+        for i, (lat, lon) in enumerate(latlons.tolist()):
+            region_name = self._get_region_name(lat, lon)
+            if not region_name:
+                logger.error(f"Coordinates ({lat}, {lon}) outside supported regions")
+                continue
+            by_region.setdefault(region_name, []).append(i)
+        
+        async def run_region(region_name: str, indices: List[int]):
             try:
-                predictions = await asyncio.wait_for(
-                    self._run_model_inference(preprocessed_data, forecast_days),
-                    timeout=timeout
+                forecasts = await self._infer_points(
+                    latlons[indices], forecast_days, region_name, timestamp
                 )
-            except asyncio.TimeoutError:
-                logger.error(f"Inference timeout after {timeout}s")
-                return None
-            
-            if predictions is None:
-                logger.error("Model inference failed")
-                return None
+            except Exception as e:
+                logger.error(f"Batch inference failed for {region_name}: {e}", exc_info=True)
+                return
+            for i, forecast in zip(indices, forecasts):
+                if forecast is not None:
+                    results[i] = self._copy_result(
+                        forecast, latlons[i, 0], latlons[i, 1], start_time, cache_hit=False
+                    )
+        
+        await asyncio.gather(*(
+            run_region(region_name, indices) for region_name, indices in by_region.items()
+        ))
+        
+        logger.info(
+            f"Batch inference for {len(latlons)} locations completed in "
+            f"{int((time.time() - start_time) * 1000)}ms"
+        )
+        return results
+    
+    async def _infer_points(
+        self,
+        latlons: "np.ndarray",
+        forecast_days: int,
+        region_name: str,
+        timestamp: datetime
+    ) -> List[Optional[ForecastResult]]:
+        """
+        Run one shared fetch/preprocess/rollout for points of one region.
+        
+        Args:
+            latlons: (N, 2) latitude/longitude pairs within the region
+            forecast_days: Number of days to forecast
+            region_name: Region containing every point
+            timestamp: Hour of the ERA5 initial conditions
             
-            # Postprocess outputs
-            logger.info("Postprocessing model outputs")
+        Returns:
+            List of N ForecastResult objects, None where postprocessing failed
+        """
+        logger.info(f"Fetching ERA5 initial conditions for {len(latlons)} locations in {region_name}")
+        era5_data = await self._fetch_initial_conditions(region_name, timestamp)
+        if era5_data is None:
+            return [None] * len(latlons)
+        
+        with profiler.profile_block("preprocess_inputs"):
+            preprocessed_data = self._preprocess_inputs(
+                era5_data, latlons[0, 0], latlons[0, 1], input_key=(region_name, timestamp)
+            )
+        if preprocessed_data is None:
+            logger.error("Input preprocessing failed")
+            return [None] * len(latlons)
+        
+        # Nearest grid point of every location at once
+        coords = preprocessed_data['coordinates']
+        lat_idx = np.abs(coords['latitude'][None, :] - latlons[:, :1]).argmin(axis=1)
+        lon_idx = np.abs(coords['longitude'][None, :] - latlons[:, 1:]).argmin(axis=1)
+        
+        # One forward pass for the region, read out at every point; padded
+        # to a power of two so only a few point counts are ever compiled
+        num_steps = forecast_days * 4
+        size = 1 << (len(latlons) - 1).bit_length()
+        pad = size - len(latlons)
+        timeout = self.timeout_gpu if self.model_manager.device == "gpu" else self.timeout_cpu
+        
+        # Compiling, dispatching and copying back block, so keep them off the event loop
+        try:
+            await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(
+                    None,
+                    self._rollout_points,
+                    tuple(preprocessed_data['shape']),
+                    num_steps,
+                    preprocessed_data['data'],
+                    np.pad(lat_idx, (0, pad), mode='edge').astype(np.int32),
+                    np.pad(lon_idx, (0, pad), mode='edge').astype(np.int32)
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Batch inference timeout after {timeout}s for {region_name}")
+            return [None] * len(latlons)
+        
+        forecasts = []
+        for i, (lat, lon) in enumerate(latlons.tolist()):
+            point_data = dict(preprocessed_data, coordinates=dict(
+                coords,
+                target_lat_idx=lat_idx[i],
+                target_lon_idx=lon_idx[i],
+                target_lat=lat,
+                target_lon=lon
+            ))
+            predictions = self._generate_synthetic_predictions(point_data, num_steps)
             with profiler.profile_block("postprocess_outputs"):
-                forecast_result = self._postprocess_outputs(
-                    predictions, lat, lon, region_name, timestamp
-                )
-            
-            # Calculate inference time
-            inference_time_ms = int((time.time() - start_time) * 1000)
-            
-            if forecast_result:
-                forecast_result.metadata.inference_time_ms = inference_time_ms
-                logger.info(f"Inference completed in {inference_time_ms}ms")
-            
-            return forecast_result
+                forecast = self._postprocess_outputs(predictions, lat, lon, region_name, timestamp)
+            if forecast is not None:
+                self._store_result((round(lat, 2), round(lon, 2), forecast_days, timestamp), forecast)
+            forecasts.append(forecast)
+        
+        return forecasts
+    
+    def _rollout_points(
+        self,
+        shape: Tuple[int, ...],
+        num_steps: int,
+        data: "jnp.ndarray",
+        lat_idx: "np.ndarray",
+        lon_idx: "np.ndarray"
+    ) -> "np.ndarray":
+        """Roll out one region and copy the (num_points, num_steps, V) readouts to the host."""
+        rollout_fn = _get_multipoint_rollout_fn(shape, num_steps, len(lat_idx))
+        return np.asarray(rollout_fn(data, lat_idx, lon_idx))
+    
+    async def _fetch_initial_conditions(
+        self,
+        region_name: str,
+        timestamp: datetime
+    ) -> Optional["xr.Dataset"]:
+        """
+        Fetch a region's ERA5 initial conditions, loading the model meanwhile.
+        
+        Args:
+            region_name: Region to fetch
+            timestamp: Hour of the ERA5 initial conditions
             
-        except Exception as e:
-            logger.error(f"Inference pipeline failed: {e}", exc_info=True)
+        Returns:
+            ERA5 dataset, or None if the fetch or model loading fails
+        """
+        bounds = REGION_BOUNDARIES[region_name]
+        
+        async def fetch_era5():
+            with profiler.profile_block("fetch_era5_data"):
+                return await self.data_fetcher.fetch_initial_conditions(
+                    lat_min=bounds["lat_min"],
+                    lat_max=bounds["lat_max"],
+                    lon_min=bounds["lon_min"],
+                    lon_max=bounds["lon_max"],
+                    timestamp=timestamp
+                )
+        
+        # Load the model (if needed) while the ERA5 fetch is in flight
+        model_loaded, era5_data = await asyncio.gather(
+            self.model_manager.ensure_loaded(),
+            fetch_era5()
+        )
+        
+        if not model_loaded:
+            logger.error("Failed to load model")
+            return None
+        
+        if era5_data is None:
+            logger.error("Failed to fetch ERA5 initial conditions")
             return None
+        
+        return era5_data
+    
+    def _store_result(self, result_key: Tuple[Any, ...], forecast_result: ForecastResult):
+        """
+        Keep a finished forecast in the in-memory result cache.
+        
+        Args:
+            result_key: Result cache key for the forecast
+            forecast_result: Finished forecast
+        """
+        if self.result_cache_size <= 0:
+            return
+        self._results[result_key] = (
+            time.monotonic() + self.result_cache_ttl, forecast_result
+        )
+        self._results.move_to_end(result_key)
+        if len(self._results) > self.result_cache_size:
+            self._results.popitem(last=False)
+    
+    def _copy_result(
+        self,
+        result: ForecastResult,
+        lat: float,
+        lon: float,
+        start_time: float,
+        cache_hit: bool
+    ) -> ForecastResult:
+        """
+        Copy a shared forecast for one caller.
+        
+        Columns are shallow-copied, so callers can replace them (e.g. with
+        agricultural metrics) without touching the cached result.
+        
+        Args:
+            result: Shared forecast result
+            lat: Caller's latitude
+            lon: Caller's longitude
+            start_time: time.time() when the caller's request started
+            cache_hit: Whether the forecast was reused rather than computed
+            
+        Returns:
+            ForecastResult owned by the caller
+        """
+        return replace(
+            result,
+            location=replace(result.location, latitude=lat, longitude=lon),
+            forecast_days=copy.copy(result.forecast_days),
+            metadata=replace(
+                result.metadata,
+                cache_hit=cache_hit,
+                inference_time_ms=int((time.time() - start_time) * 1000)
+            )
+        )
     
     def _get_region_name(self, lat: float, lon: float) -> Optional[str]:
         """
@@ -226,23 +799,25 @@ class GraphCastInferencePipeline:
         Returns:
             Region name or None if not in any region
         """
-        for region_name, bounds in REGION_BOUNDARIES.items():
-            if (bounds["lat_min"] <= lat <= bounds["lat_max"] and
-                bounds["lon_min"] <= lon <= bounds["lon_max"]):
-                return region_name
-        return None
+        # Test every region at once; argmax picks the first match like a scan would
+        mask = ((_REGION_BOX[:, 0] <= lat) & (lat <= _REGION_BOX[:, 1]) &
+                (_REGION_BOX[:, 2] <= lon) & (lon <= _REGION_BOX[:, 3]))
+        if not mask.any():
+            return None
+        return _REGION_NAMES[int(mask.argmax())]
     
     def _preprocess_inputs(
         self,
         era5_data: "xr.Dataset",
         target_lat: float,
-        target_lon: float
+        target_lon: float,
+        input_key: Optional[Tuple[str, datetime]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Convert ERA5 data to GraphCast input format.
         
         This includes:
-        - Converting XArray dataset to JAX arrays
+        - Converting XArray dataset to a stacked JAX array
         - Normalizing input variables to model expected ranges
         - Handling missing data with interpolation or default values
         - Reshaping data to match GraphCast input dimensions
@@ -251,49 +826,32 @@ class GraphCastInferencePipeline:
             era5_data: ERA5 dataset from fetcher
             target_lat: Target latitude for forecast
             target_lon: Target longitude for forecast
+            input_key: (region name, ERA5 hour) of the data; when given, the
+                device array is cached and reused for later requests
             
         Returns:
-            Dictionary containing preprocessed data or None if preprocessing fails
+            Dictionary containing preprocessed data or None if preprocessing fails.
+            'data' holds all variables stacked on axis 0; 'variables' maps
+            standard variable names to their index on that axis.
         """
         try:
             if np is None or jnp is None:
                 logger.error("NumPy or JAX not installed")
                 return None
             
-            # Extract variables from ERA5 dataset
-            # Map ERA5 variable names to standard names
-            variable_mapping = {
-                't2m': 'temperature',
-                'sp': 'pressure',
-                'r': 'humidity',
-                'u10': 'u_wind',
-                'v10': 'v_wind'
-            }
-            
-            extracted_data = {}
-            
-            for era5_var, standard_var in variable_mapping.items():
-                if era5_var in era5_data.variables:
-                    # Extract data as numpy array
-                    data_array = era5_data[era5_var].values
-                    
-                    # Handle missing data
-                    if np.isnan(data_array).any():
-                        logger.warning(f"Missing data detected in {standard_var}, interpolating")
-                        data_array = self._interpolate_missing_data(data_array)
-                    
-                    extracted_data[standard_var] = data_array
-                else:
-                    logger.error(f"Required variable {era5_var} not found in ERA5 data")
+            # Inputs of a region and hour already on the device skip the
+            # extraction, host-to-device copy and normalization entirely
+            jax_data = self._device_inputs.get(input_key) if input_key is not None else None
+            if jax_data is not None:
+                self._device_inputs.move_to_end(input_key)
+            else:
+                jax_data = self._to_device_inputs(era5_data)
+                if jax_data is None:
                     return None
-            
-            # Normalize variables to expected ranges
-            normalized_data = self._normalize_variables(extracted_data)
-            
-            # Convert to JAX arrays
-            jax_data = {
-                key: jnp.array(value) for key, value in normalized_data.items()
-            }
+                if input_key is not None and self.device_input_cache_size > 0:
+                    self._device_inputs[input_key] = jax_data
+                    if len(self._device_inputs) > self.device_input_cache_size:
+                        self._device_inputs.popitem(last=False)
             
             # Get spatial coordinates
             if 'latitude' in era5_data.coords and 'longitude' in era5_data.coords:
@@ -309,6 +867,7 @@ class GraphCastInferencePipeline:
             
             preprocessed = {
                 'data': jax_data,
+                'variables': dict(_VARIABLE_INDEX),
                 'coordinates': {
                     'latitude': lats,
                     'longitude': lons,
@@ -318,7 +877,7 @@ class GraphCastInferencePipeline:
                     'target_lon': target_lon
                 },
                 'timestamp': era5_data.attrs.get('timestamp', datetime.utcnow()),
-                'shape': list(jax_data['temperature'].shape)
+                'shape': list(jax_data.shape)
             }
             
             logger.info(f"Preprocessed data shape: {preprocessed['shape']}")
@@ -328,72 +887,84 @@ class GraphCastInferencePipeline:
             logger.error(f"Error preprocessing inputs: {e}", exc_info=True)
             return None
     
-    def _interpolate_missing_data(self, data: "np.ndarray") -> "np.ndarray":
+    def _to_device_inputs(self, era5_data: "xr.Dataset") -> Optional["jnp.ndarray"]:
         """
-        Interpolate missing data (NaN values) using linear interpolation.
+        Stack, fill and normalize the ERA5 variables into one device array.
         
         Args:
-            data: NumPy array with potential NaN values
+            era5_data: ERA5 dataset from fetcher
             
         Returns:
-            Array with NaN values interpolated
+            Normalized (V, ...) device array, or None if a variable is missing
         """
-        if not np.isnan(data).any():
-            return data
-        
-        # Create a copy to avoid modifying original
-        interpolated = data.copy()
+        for era5_var in _VARIABLE_MAPPING:
+            if era5_var not in era5_data.variables:
+                logger.error(f"Required variable {era5_var} not found in ERA5 data")
+                return None
         
-        # Get mask of valid (non-NaN) values
-        valid_mask = ~np.isnan(data)
+        # Extract all variables from the ERA5 dataset in one materialization,
+        # as one contiguous float32 buffer that moves to the device in a
+        # single transfer
+        stacked = era5_data[list(_VARIABLE_MAPPING)].to_array().values.astype(np.float32, copy=False)
         
-        if not valid_mask.any():
-            # All values are NaN, use default value (0)
-            logger.warning("All values are NaN, using default value 0")
-            return np.zeros_like(data)
+        # Normalize and fill missing data in one compiled kernel, which also
+        # counts the missing values of each variable
+        inputs, missing = self._preprocess_kernel(stacked.shape)(jax.device_put(stacked))
+        for standard_var, count in zip(_VARIABLE_MAPPING.values(), np.asarray(missing).tolist()):
+            if count:
+                logger.warning(
+                    f"Missing data detected in {standard_var} ({count} values), "
+                    f"filling with the climatological mean"
+                )
+        return inputs
+    
+    def _preprocess_kernel(self, shape: Tuple[int, ...]) -> Any:
+        """
+        Get the compiled preprocessing kernel for a stacked input shape.
         
-        # For simplicity, replace NaN with mean of valid values
-        # In production, more sophisticated interpolation could be used
-        mean_value = np.nanmean(data)
-        interpolated[~valid_mask] = mean_value
+        Normalization, NaN filling and the cast to the rollout dtype are
+        traced together so XLA fuses them into a single elementwise pass,
+        which also counts the NaNs of each variable. Kernels are compiled
+        once per shape.
         
-        return interpolated
+        Args:
+            shape: Shape of the stacked (V, ...) float32 input
+            
+        Returns:
+            Compiled function mapping raw float32 inputs to normalized
+            inputs in the rollout dtype and (V,) counts of missing values
+        """
+        kernel = self._preprocess_kernels.get(shape)
+        if kernel is None:
+            kernel = jax.jit(
+                lambda x: (
+                    self._normalize_variables(x).astype(_ROLLOUT_DTYPE),
+                    jnp.isnan(x).reshape(x.shape[0], -1).sum(axis=1)
+                )
+            ).lower(jax.ShapeDtypeStruct(shape, jnp.float32)).compile()
+            self._preprocess_kernels[shape] = kernel
+        return kernel
     
-    def _normalize_variables(self, data: Dict[str, "np.ndarray"]) -> Dict[str, "np.ndarray"]:
+    def _normalize_variables(self, data: "jnp.ndarray") -> "jnp.ndarray":
         """
         Normalize input variables to model expected ranges.
         
         GraphCast expects normalized inputs. This function applies
         standard normalization based on typical atmospheric ranges.
+        Missing data (NaN values) is filled with 0, the normalized
+        climatological mean, in the same elementwise pass.
         
         Args:
-            data: Dictionary of variable name to numpy array
+            data: Stacked (V, ...) array in _VARIABLE_MAPPING order
             
         Returns:
-            Dictionary of normalized arrays
-        """
-        # Normalization parameters (mean, std) for each variable
-        # These are approximate values for ERA5 data
-        normalization_params = {
-            'temperature': {'mean': 273.15, 'std': 20.0},  # Kelvin
-            'pressure': {'mean': 101325.0, 'std': 10000.0},  # Pascal
-            'humidity': {'mean': 50.0, 'std': 30.0},  # Percent
-            'u_wind': {'mean': 0.0, 'std': 5.0},  # m/s
-            'v_wind': {'mean': 0.0, 'std': 5.0},  # m/s
-        }
-        
-        normalized = {}
-        
-        for var_name, var_data in data.items():
-            if var_name in normalization_params:
-                params = normalization_params[var_name]
-                # Z-score normalization: (x - mean) / std
-                normalized[var_name] = (var_data - params['mean']) / params['std']
-            else:
-                # If no normalization params, keep as is
-                normalized[var_name] = var_data
-        
-        return normalized
+            Array of normalized values with the same shape and no NaNs
+        """
+        # Broadcast the (V,) constants over the trailing dimensions
+        expand = (-1,) + (1,) * (data.ndim - 1)
+        # Z-score normalization: (x - mean) / std
+        normalized = (data - _NORM_MEAN.reshape(expand)) * _INV_STD.reshape(expand)
+        return jnp.where(jnp.isnan(data), jnp.float32(0), normalized)
     
     async def _run_model_inference(
         self,
@@ -403,7 +974,8 @@ class GraphCastInferencePipeline:
         """
         Run GraphCast model inference with autoregressive rollout.
         
-        This is a placeholder implementation. In production, this would:
+        The rollout is compiled once per input shape and length. Its step
+        function and the surface outputs are placeholders. In production, this would:
         1. Load the actual GraphCast model
         2. Run autoregressive rollout (each step uses previous prediction)
         3. Generate predictions at 6-hour intervals
@@ -424,8 +996,12 @@ class GraphCastInferencePipeline:
             # Calculate number of 6-hour steps (4 steps per day)
             num_steps = forecast_days * 4
             
-            # Simulate inference (in production, this would be actual model execution)
-            # For now, generate synthetic predictions
+            # Roll out the model state at the target grid point; the
+            # placeholder step does not drive the surface outputs yet
+            await self._rollout(preprocessed_data, num_steps)
+            
+            # Simulate surface outputs (in production, these would be read
+            # out of the model)
             predictions = self._generate_synthetic_predictions(
                 preprocessed_data, num_steps
             )
@@ -436,6 +1012,95 @@ class GraphCastInferencePipeline:
             logger.error(f"Model inference failed: {e}", exc_info=True)
             return None
     
+    async def _rollout(self, preprocessed_data: Dict[str, Any], num_steps: int) -> "jnp.ndarray":
+        """
+        Run the rollout for one request, batched with concurrent requests.
+        
+        Requests with the same input shape and length that arrive within
+        the batching window are stacked and dispatched as one vmapped
+        rollout. A full batch is dispatched immediately.
+        
+        Args:
+            preprocessed_data: Preprocessed input data
+            num_steps: Number of 6-hour steps to roll out
+            
+        Returns:
+            (num_steps, V) readouts at the target grid point
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, tuple(preprocessed_data['shape']), num_steps)
+        coords = preprocessed_data['coordinates']
+        future = loop.create_future()
+        
+        batch = self._pending_batches.get(key)
+        if batch is None:
+            batch = self._pending_batches[key] = []
+            loop.call_later(self.batch_window, self._dispatch_batch, key, batch)
+        
+        batch.append((
+            preprocessed_data['data'],
+            coords['target_lat_idx'],
+            coords['target_lon_idx'],
+            future
+        ))
+        if len(batch) >= self.batch_max_size:
+            self._dispatch_batch(key, batch)
+        
+        return await future
+    
+    def _dispatch_batch(self, key: Hashable, batch: List[Tuple[Any, ...]]):
+        """
+        Start a pending batch of rollouts and resolve its futures when done.
+        
+        Args:
+            key: Pending batch key (event loop, input shape, num_steps)
+            batch: (data, lat_idx, lon_idx, future) entries of the batch
+        """
+        if self._pending_batches.get(key) is not batch:
+            # Already dispatched when it filled up
+            return
+        del self._pending_batches[key]
+        
+        loop, shape, num_steps = key
+        # Compiling a new shape blocks, so keep it off the event loop
+        dispatch = loop.run_in_executor(None, self._run_batch, shape, num_steps, batch)
+        dispatch.add_done_callback(functools.partial(self._resolve_batch, batch))
+    
+    def _run_batch(
+        self,
+        shape: Tuple[int, ...],
+        num_steps: int,
+        batch: List[Tuple[Any, ...]]
+    ) -> List["jnp.ndarray"]:
+        """Run one batch of rollouts and return the readouts of each entry."""
+        # Pad to a power of two so only a few batch sizes are ever compiled
+        size = 1 << (len(batch) - 1).bit_length()
+        padded = batch + batch[:1] * (size - len(batch))
+        
+        rollout_fn = _get_rollout_fn(shape, num_steps, size)
+        # The stacked batch is a fresh buffer, safe to donate
+        _, readouts = rollout_fn(
+            jnp.stack([entry[0] for entry in padded]),
+            np.array([entry[1] for entry in padded], dtype=np.int32),
+            np.array([entry[2] for entry in padded], dtype=np.int32)
+        )
+        
+        logger.debug(f"Dispatched rollout batch of {len(batch)} (padded to {size})")
+        return [readouts[i] for i in range(len(batch))]
+    
+    @staticmethod
+    def _resolve_batch(batch: List[Tuple[Any, ...]], dispatch: "asyncio.Future"):
+        """Hand each entry of a finished batch its readouts or the batch's error."""
+        error = asyncio.CancelledError() if dispatch.cancelled() else dispatch.exception()
+        for i, (*_, future) in enumerate(batch):
+            # Requests that timed out have already been cancelled
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(dispatch.result()[i])
+    
     def _generate_synthetic_predictions(
         self,
         preprocessed_data: Dict[str, Any],
@@ -459,31 +1124,39 @@ class GraphCastInferencePipeline:
         target_lon_idx = coords['target_lon_idx']
         
         # Generate synthetic time series
-        # Use simple patterns that look like weather data
-        np.random.seed(42)  # For reproducibility
+        # Use simple patterns that look like weather data. A local generator
+        # keeps this reproducible without touching NumPy's global RNG state
+        rng = np.random.default_rng(42)
+        
+        # All Gaussian noise in one draw: temperature, u/v wind, pressure
+        noise = rng.standard_normal((4, num_steps), dtype=np.float32)
+        noise *= np.array([2.0, 3.0, 3.0, 200.0], dtype=np.float32)[:, None]
+        temp_noise, u_noise, v_noise, pressure_noise = noise
+        
+        # One full cycle over the forecast horizon
+        cycle = np.sin(np.linspace(0, 2*np.pi, num_steps, dtype=np.float32))
         
         # Temperature: sinusoidal pattern with noise (in Kelvin)
         base_temp = 298.15  # ~25°C
         temp_amplitude = 10.0
-        temperatures = base_temp + temp_amplitude * np.sin(np.linspace(0, 2*np.pi, num_steps))
-        temperatures += np.random.normal(0, 2, num_steps)
+        temperatures = base_temp + temp_amplitude * cycle + temp_noise
         
         # Precipitation: random with occasional spikes (in mm/6h)
-        precipitation = np.random.exponential(2.0, num_steps)
+        precipitation = rng.standard_exponential(num_steps, dtype=np.float32) * 2.0
         precipitation = np.clip(precipitation, 0, 50)
         
         # Humidity: correlated with precipitation (in %)
-        humidity = 50 + 20 * np.sin(np.linspace(0, 2*np.pi, num_steps))
+        humidity = 50 + 20 * cycle
         humidity += precipitation * 0.5
         humidity = np.clip(humidity, 20, 100)
         
         # Wind components (in m/s)
-        u_wind = np.random.normal(2.0, 3.0, num_steps)
-        v_wind = np.random.normal(1.0, 3.0, num_steps)
+        u_wind = 2.0 + u_noise
+        v_wind = 1.0 + v_noise
         
         # Pressure: slowly varying (in Pa)
         pressure = 101325 + 1000 * np.sin(np.linspace(0, np.pi, num_steps))
-        pressure += np.random.normal(0, 200, num_steps)
+        pressure += pressure_noise
         
         predictions = {
             'temperature': temperatures,
@@ -527,6 +1200,10 @@ class GraphCastInferencePipeline:
             ForecastResult or None if postprocessing fails
         """
         try:
+            # Bring the whole prediction pytree to the host in one transfer;
+            # everything below is NumPy, so no per-element device syncs
+            predictions = jax.device_get(predictions)
+            
             # Extract predictions
             temperatures = predictions['temperature']
             precipitation = predictions['precipitation']
@@ -538,70 +1215,46 @@ class GraphCastInferencePipeline:
             # Aggregate 6-hour predictions to daily values using vectorized operations
             num_days = num_steps // 4
             
-            # Reshape arrays for efficient daily aggregation
-            temps_reshaped = temperatures[:num_days*4].reshape(num_days, 4)
-            precip_reshaped = precipitation[:num_days*4].reshape(num_days, 4)
-            humidity_reshaped = humidity[:num_days*4].reshape(num_days, 4)
-            u_wind_reshaped = u_wind[:num_days*4].reshape(num_days, 4)
-            v_wind_reshaped = v_wind[:num_days*4].reshape(num_days, 4)
+            num_used = num_days * 4
             
-            # Vectorized daily aggregates
-            temp_max_c = np.max(temps_reshaped, axis=1) - 273.15  # Convert K to C
-            temp_min_c = np.min(temps_reshaped, axis=1) - 273.15
-            temp_mean_c = np.mean(temps_reshaped, axis=1) - 273.15
-            precip_mm = np.sum(precip_reshaped, axis=1)
-            humidity_pct = np.mean(humidity_reshaped, axis=1)
+            # Wind speed from components, computed once for all steps
+            wind_speeds = np.hypot(u_wind[:num_used], v_wind[:num_used])
+            
+            # Stack the daily-averaged variables as (variable, day, step) so one
+            # mean reduction covers temperature, humidity and wind speed
+            per_day = np.stack(
+                [temperatures[:num_used], humidity[:num_used], wind_speeds]
+            ).reshape(3, num_days, 4)
+            temp_mean_k, humidity_pct, wind_speed_ms = per_day.mean(axis=2)
             
-            # Calculate wind speed from components - vectorized
-            wind_speeds = np.sqrt(u_wind_reshaped**2 + v_wind_reshaped**2)
-            wind_speed_ms = np.mean(wind_speeds, axis=1)
+            # Vectorized daily aggregates
+            temp_max_c = per_day[0].max(axis=1) - 273.15  # Convert K to C
+            temp_min_c = per_day[0].min(axis=1) - 273.15
+            temp_mean_c = temp_mean_k - 273.15
+            precip_mm = precipitation[:num_used].reshape(num_days, 4).sum(axis=1)
             
             # Pre-calculate confidence scores
             confidence_scores = np.maximum(0.5, 1.0 - (np.arange(num_days) * 0.05))
             
-            daily_forecasts = []
-            
-            for day in range(num_days):
-                # Use pre-calculated values
-                temp_max_val = float(temp_max_c[day])
-                temp_min_val = float(temp_min_c[day])
-                temp_mean_val = float(temp_mean_c[day])
-                precip_val = float(precip_mm[day])
-                humidity_val = float(humidity_pct[day])
-                wind_speed_val = float(wind_speed_ms[day])
-                
-                # Create raw weather data
-                raw_weather = RawWeatherData(
-                    precipitation_mm=precip_val,
-                    temp_max_c=temp_max_val,
-                    temp_min_c=temp_min_val,
-                    temp_mean_c=temp_mean_val,
-                    humidity_percent=humidity_val,
-                    wind_speed_ms=wind_speed_val
-                )
-                
-                # Calculate forecast date
-                forecast_date = era5_timestamp + timedelta(days=day + 1)
-                
+            # Keep the daily values as columns; ForecastDay objects are only
+            # built when the result is serialized
+            daily_forecasts = ForecastDaysSoA(
+                dates=np.datetime64(era5_timestamp, 'us') + np.arange(1, num_days + 1, dtype='timedelta64[D]'),
                 # Placeholder values for agricultural metrics
                 # These will be calculated by the agricultural metrics calculator
-                rain_risk = 0.0
-                temp_extreme = 0.0
-                soil_moisture_proxy = 0.0
-                
-                # Use pre-calculated confidence score
-                confidence_score = float(confidence_scores[day])
-                
-                forecast_day = ForecastDay(
-                    date=forecast_date,
-                    rain_risk=rain_risk,
-                    temp_extreme=temp_extreme,
-                    soil_moisture_proxy=soil_moisture_proxy,
-                    confidence_score=confidence_score,
-                    raw_weather=raw_weather
-                )
-                
-                daily_forecasts.append(forecast_day)
+                rain_risk=np.zeros(num_days),
+                temp_extreme=np.zeros(num_days),
+                soil_moisture_proxy=np.zeros(num_days),
+                confidence_score=confidence_scores,
+                raw_weather={
+                    'precipitation_mm': precip_mm,
+                    'temp_max_c': temp_max_c,
+                    'temp_min_c': temp_min_c,
+                    'temp_mean_c': temp_mean_c,
+                    'humidity_percent': humidity_pct,
+                    'wind_speed_ms': wind_speed_ms
+                }
+            )
             
             # Create location
             location = Location(
@@ -5,6 +5,11 @@ Handles loading, caching, and managing GraphCast model weights.
 
 import logging
 import hashlib
+import json
+import math
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 import asyncio
@@ -13,6 +18,28 @@ from .config import MODEL_CONFIG, INFERENCE_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Read size for hashing weights files; large reads keep the syscall count
+# low and hand hashlib long contiguous runs
+_HASH_CHUNK = 4 * 1024 * 1024
+
+# Tree hash: SHA-256 over the concatenated SHA-256 digests of fixed-size
+# shards, which can be hashed on separate cores
+_TREE_ALGORITHM = "sha256-tree-64M"
+_TREE_SHARD = 64 * 1024 * 1024
+
+
+def _available_memory() -> int:
+    """
+    Return the physical memory currently available, in bytes.
+    
+    Returns:
+        Available memory, or 0 if the platform does not report it
+    """
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return 0
+
 
 class GraphCastModelManager:
     """
@@ -29,6 +56,8 @@ class GraphCastModelManager:
             device: Device to use for inference ("cpu", "cuda", "auto")
         """
         self.model_path = Path(model_path) if model_path else MODEL_CONFIG["weights_path"]
+        # Sidecar remembering the checksum of the weights at a given size and mtime
+        self._checksum_cache_path = self.model_path.with_suffix(self.model_path.suffix + ".sha256.json")
         self.device = self._select_device(device)
         self.model = None
         self._is_loaded = False
@@ -84,8 +113,10 @@ class GraphCastModelManager:
                     logger.info("Model weights need to be downloaded. Use download_weights.py script.")
                     return False
                 
-                # Validate weights file
-                if not self._validate_weights_file():
+                # Validate weights file; the checksum can take seconds on
+                # multi-GB weights, so it runs in a worker thread to keep the
+                # event loop serving requests
+                if not await asyncio.to_thread(self._validate_weights_file):
                     logger.error("Model weights validation failed")
                     return False
                 
@@ -117,11 +148,13 @@ class GraphCastModelManager:
             True if file is valid, False otherwise
         """
         try:
-            if not self.model_path.exists():
+            # One stat call answers both existence and size
+            try:
+                file_size = os.stat(self.model_path).st_size
+            except FileNotFoundError:
                 logger.error(f"Weights file does not exist: {self.model_path}")
                 return False
             
-            file_size = self.model_path.stat().st_size
             if file_size < 1024 * 1024:  # Less than 1MB is suspicious
                 logger.error(f"Weights file is too small: {file_size} bytes")
                 return False
@@ -130,7 +163,7 @@ class GraphCastModelManager:
             
             # If checksum is provided in config, validate it
             if MODEL_CONFIG.get("weights_checksum"):
-                checksum = self._calculate_checksum()
+                checksum = self._calculate_checksum(MODEL_CONFIG.get("checksum_algorithm", "sha256"))
                 if checksum != MODEL_CONFIG["weights_checksum"]:
                     logger.error("Checksum validation failed")
                     return False
@@ -146,21 +179,144 @@ class GraphCastModelManager:
         """
         Calculate checksum of weights file.
         
+        The result is cached in a sidecar file next to the weights and
+        reused while the file's size and modification time are unchanged,
+        so restarts do not rehash multi-GB weights.
+        
         Args:
             algorithm: Hash algorithm to use
             
         Returns:
             Hexadecimal checksum string
         """
-        hash_obj = hashlib.new(algorithm)
+        st = self.model_path.stat()
+        
+        try:
+            cached = json.loads(self._checksum_cache_path.read_text())
+            if (
+                cached.get("size") == st.st_size
+                and cached.get("mtime_ns") == st.st_mtime_ns
+                and cached.get(algorithm)
+            ):
+                logger.debug(f"Using cached {algorithm} checksum for {self.model_path}")
+                return cached[algorithm]
+        except (OSError, ValueError, AttributeError):
+            cached = {}
+        
+        checksum = self._hash_file(algorithm)
         
-        with open(self.model_path, "rb") as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_obj.update(chunk)
+        # Keep digests for other algorithms recorded for the same file state
+        if cached.get("size") != st.st_size or cached.get("mtime_ns") != st.st_mtime_ns:
+            cached = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        cached[algorithm] = checksum
+        
+        # Write to a private temp file and rename it over the sidecar, so a
+        # concurrent reader never sees a partially written file
+        tmp_path = self._checksum_cache_path.with_name(
+            f"{self._checksum_cache_path.name}.tmp.{os.getpid()}"
+        )
+        try:
+            tmp_path.write_text(json.dumps(cached))
+            os.replace(tmp_path, self._checksum_cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache weights checksum: {e}")
+            tmp_path.unlink(missing_ok=True)
+        
+        return checksum
+    
+    def _hash_file(self, algorithm: str) -> str:
+        """
+        Hash the weights file from disk.
+        
+        Args:
+            algorithm: Hash algorithm to use
+            
+        Returns:
+            Hexadecimal checksum string
+        """
+        if algorithm == _TREE_ALGORITHM:
+            return self._calculate_checksum_parallel()
+        
+        # Unbuffered so reads go straight to the OS without an extra copy
+        with open(self.model_path, "rb", buffering=0) as f:
+            # Files that fit comfortably in memory are mapped and hashed in a
+            # single update, with no user-space read buffer at all
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size < _available_memory() * 0.5:
+                hash_obj = hashlib.new(algorithm)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_obj.update(mm)
+                return hash_obj.hexdigest()
+            
+            # Python 3.11+ reads and hashes entirely in C, releasing the GIL
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            
+            # Read in chunks into one reused buffer to handle large files
+            hash_obj = hashlib.new(algorithm)
+            buf = bytearray(_HASH_CHUNK)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hash_obj.update(view[:n])
         
         return hash_obj.hexdigest()
     
+    def _calculate_checksum_parallel(self, shard_size: int = _TREE_SHARD) -> str:
+        """
+        Calculate the tree checksum of weights file across worker threads.
+        
+        Each shard is hashed with SHA-256 in its own thread, and the shard
+        digests are hashed again in file order. hashlib releases the GIL
+        while hashing, so shards run on separate cores.
+        
+        Args:
+            shard_size: Bytes per shard
+            
+        Returns:
+            Hexadecimal checksum string
+        """
+        size = self.model_path.stat().st_size
+        n_shards = max(1, math.ceil(size / shard_size))
+        
+        def hash_shard(offset: int) -> bytes:
+            hash_obj = hashlib.sha256()
+            buf = bytearray(min(_HASH_CHUNK, shard_size))
+            view = memoryview(buf)
+            remaining = min(shard_size, size - offset)
+            # Each worker reads through its own file descriptor
+            with open(self.model_path, "rb", buffering=0) as f:
+                f.seek(offset)
+                while remaining > 0:
+                    n = f.readinto(view[:min(len(buf), remaining)])
+                    if not n:
+                        break
+                    hash_obj.update(view[:n])
+                    remaining -= n
+            return hash_obj.digest()
+        
+        workers = min(os.cpu_count() or 1, n_shards)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = pool.map(hash_shard, range(0, n_shards * shard_size, shard_size))
+            return hashlib.sha256(b"".join(digests)).hexdigest()
+    
+    async def ensure_loaded(self) -> bool:
+        """
+        Make sure the model is loaded, loading it on first use.
+        Returns immediately without taking the loading lock once loaded.
+        
+        Returns:
+            True if model is loaded, False if loading failed
+        """
+        if self._is_loaded:
+            return True
+        logger.info("Model not loaded, loading now...")
+        return await self.load_model()
+    
     def is_model_loaded(self) -> bool:
         """
         Check if model is ready for inference.
@@ -185,8 +341,10 @@ class GraphCastModelManager:
             "weights_url": MODEL_CONFIG["weights_url"],
         }
         
-        if self.model_path.exists():
-            info["weights_size_gb"] = self.model_path.stat().st_size / (1024**3)
+        try:
+            info["weights_size_gb"] = os.stat(self.model_path).st_size / (1024**3)
+        except FileNotFoundError:
+            pass
         
         return info
     
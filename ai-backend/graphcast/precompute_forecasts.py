@@ -5,12 +5,12 @@ Pre-computes forecasts for major Maharashtra cities to populate cache.
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import List, Dict, Tuple
-import schedule
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 import time
 
-from .cache_manager import ForecastCacheManager
+from .cache_manager import ForecastCacheManager, create_cache_manager
 from .config import CACHE_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -59,7 +59,15 @@ class ForecastPrecomputeScheduler:
         self.cache_manager = cache_manager
         self.inference_pipeline = inference_pipeline
         self.cities = cities or MAHARASHTRA_CITIES
+        # The same cities column-wise, for batched inference and cache lookups.
+        # Coordinates stay float64 so cache keys match those of user requests
+        self._names = [city["name"] for city in self.cities]
+        self._lats = np.array([city["lat"] for city in self.cities], dtype=np.float64)
+        self._lons = np.array([city["lon"] for city in self.cities], dtype=np.float64)
+        self.concurrency = max(1, CACHE_CONFIG["precompute_concurrency"])
         self.is_running = False
+        # (hour, minute) UTC of the daily pre-computation
+        self.daily_time_utc = (0, 0)
         
         logger.info(f"ForecastPrecomputeScheduler initialized with {len(self.cities)} cities")
     
@@ -119,6 +127,56 @@ class ForecastPrecomputeScheduler:
             logger.error(f"  ✗ {city_name}: Error - {e}")
             return False, f"{city_name}: Error - {str(e)}"
     
+    async def precompute_batch(self, forecast_days: int = 10) -> List[Tuple[bool, str]]:
+        """
+        Pre-compute forecasts for all uncached cities in one batched inference.
+        
+        Args:
+            forecast_days: Number of forecast days
+            
+        Returns:
+            (success, message) per city, in city order
+        """
+        outcomes: List[Tuple[bool, str]] = [None] * len(self._names)
+        lats = self._lats.tolist()
+        lons = self._lons.tolist()
+        
+        # Check which cities are already cached
+        pending = []
+        for i, name in enumerate(self._names):
+            if self.cache_manager.get_forecast(lats[i], lons[i], forecast_days):
+                logger.info(f"  ✓ {name}: Already cached, skipping")
+                outcomes[i] = (True, f"{name}: Already cached")
+            else:
+                pending.append(i)
+        
+        if not pending:
+            return outcomes
+        
+        # One forward pass per region for every remaining city
+        start_time = time.time()
+        latlons = np.stack((self._lats, self._lons), axis=1)[pending]
+        try:
+            forecasts = await self.inference_pipeline.run_inference_batch(latlons, forecast_days)
+        except Exception as e:
+            logger.error(f"  ✗ Batch inference failed: {e}")
+            forecasts = [e] * len(pending)
+        elapsed = time.time() - start_time
+        
+        for i, forecast in zip(pending, forecasts):
+            name = self._names[i]
+            if forecast is None or isinstance(forecast, Exception):
+                logger.error(f"  ✗ {name}: Error - {forecast or 'inference failed'}")
+                outcomes[i] = (False, f"{name}: Error - {forecast or 'inference failed'}")
+                continue
+            
+            # Store in cache
+            self.cache_manager.set_forecast(lats[i], lons[i], forecast_days, forecast)
+            logger.info(f"  ✓ {name}: Forecast generated and cached ({elapsed:.1f}s)")
+            outcomes[i] = (True, f"{name}: Generated in {elapsed:.1f}s")
+        
+        return outcomes
+    
     async def precompute_all_forecasts(self, forecast_days: int = 10) -> Dict:
         """
         Pre-compute forecasts for all cities.
@@ -144,9 +202,28 @@ class ForecastPrecomputeScheduler:
             "details": []
         }
         
-        # Pre-compute forecasts sequentially (to avoid overwhelming the system)
-        for city in self.cities:
-            success, message = await self.precompute_city_forecast(city, forecast_days)
+        if hasattr(self.inference_pipeline, "run_inference_batch"):
+            # All cities in one batched inference
+            outcomes = await self.precompute_batch(forecast_days)
+        else:
+            # Pre-compute forecasts concurrently, bounded by a semaphore (to
+            # avoid overwhelming the system)
+            semaphore = asyncio.Semaphore(self.concurrency)
+            
+            async def precompute_one(city: Dict) -> Tuple[bool, str]:
+                async with semaphore:
+                    return await self.precompute_city_forecast(city, forecast_days)
+            
+            outcomes = await asyncio.gather(
+                *(precompute_one(city) for city in self.cities),
+                return_exceptions=True
+            )
+        
+        for name, outcome in zip(self._names, outcomes):
+            if isinstance(outcome, BaseException):
+                success, message = False, f"{name}: Error - {outcome}"
+            else:
+                success, message = outcome
             
             if success:
                 if "Already cached" in message:
@@ -157,7 +234,7 @@ class ForecastPrecomputeScheduler:
                 results["failed"] += 1
             
             results["details"].append({
-                "city": city["name"],
+                "city": name,
                 "success": success,
                 "message": message
             })
@@ -181,33 +258,55 @@ class ForecastPrecomputeScheduler:
         
         Args:
             time_utc: Time in HH:MM format (UTC)
-        """
-        def job():
-            """Wrapper to run async precomputation"""
-            if self.is_running:
-                logger.warning("Pre-computation already running, skipping")
-                return
             
-            self.is_running = True
-            try:
-                asyncio.run(self.precompute_all_forecasts())
-            finally:
-                self.is_running = False
-        
-        schedule.every().day.at(time_utc).do(job)
+        Raises:
+            ValueError: If time_utc is not a valid HH:MM time
+        """
+        parsed = datetime.strptime(time_utc, "%H:%M")
+        self.daily_time_utc = (parsed.hour, parsed.minute)
         logger.info(f"Scheduled daily pre-computation at {time_utc} UTC")
     
-    def run_scheduler(self):
+    def seconds_until_next_run(self, now: Optional[datetime] = None) -> float:
         """
-        Run the scheduler loop (blocking).
+        Get the time left until the next scheduled pre-computation.
         
-        This should be run in a separate thread or process.
+        Args:
+            now: Current UTC time (default: now)
+            
+        Returns:
+            Seconds until the next run, always positive
+        """
+        now = now or datetime.now(timezone.utc)
+        hour, minute = self.daily_time_utc
+        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
+    
+    async def run_scheduler(self):
+        """
+        Run the scheduler loop.
+        
+        Sleeps until exactly the scheduled time instead of polling, so the
+        loop is idle between runs. Run it as an asyncio task; cancelling
+        the task stops the scheduler.
         """
         logger.info("Starting pre-computation scheduler loop")
         
         while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            await asyncio.sleep(self.seconds_until_next_run())
+            
+            if self.is_running:
+                logger.warning("Pre-computation already running, skipping")
+                continue
+            
+            self.is_running = True
+            try:
+                await self.precompute_all_forecasts()
+            except Exception as e:
+                logger.error(f"Scheduled pre-computation failed: {e}", exc_info=True)
+            finally:
+                self.is_running = False
 
 
 async def run_precomputation_once(
@@ -250,7 +349,7 @@ if __name__ == "__main__":
     )
     
     # Initialize cache manager
-    cache_manager = ForecastCacheManager()
+    cache_manager = create_cache_manager()
     
     # Run pre-computation without inference pipeline (will only check cache)
     logger.info("Running manual pre-computation (cache check only)")
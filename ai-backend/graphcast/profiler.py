@@ -3,11 +3,12 @@ Performance Profiler for GraphCast Backend
 Provides profiling utilities to measure and optimize function execution times.
 """
 
+import os
+import sys
 import time
 import functools
 import logging
-from typing import Callable, Any, Dict, Optional
-from collections import defaultdict
+from typing import Callable, Any, Dict, List, Optional, Tuple
 import cProfile
 import pstats
 import io
@@ -15,6 +16,39 @@ from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Read once at import: when profiling is switched off via the environment,
+# profile_function() hands back the undecorated function so hot paths pay
+# no wrapper cost at all.
+PROFILING_ENABLED = os.getenv("GRAPHCAST_PROFILING", "1").strip().lower() not in ("0", "false", "no", "off")
+
+# Integer nanosecond clock, bound at module scope for the timing fast path
+perf_counter_ns = time.perf_counter_ns
+
+
+class _Metric:
+    """Timing totals for one function or block, in integer nanoseconds."""
+    
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns")
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        """Zero all totals."""
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+    
+    def add(self, elapsed_ns: int):
+        """Record one timing."""
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.count == 1 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
 
 class PerformanceProfiler:
     """
@@ -23,14 +57,28 @@ class PerformanceProfiler:
     
     def __init__(self):
         """Initialize profiler with empty metrics."""
-        self.metrics = defaultdict(lambda: {
-            'count': 0,
-            'total_time_ms': 0.0,
-            'min_time_ms': float('inf'),
-            'max_time_ms': 0.0,
-            'avg_time_ms': 0.0
-        })
-        self.enabled = True
+        # Times are accumulated as integer nanoseconds and only converted
+        # to milliseconds when metrics are read
+        self.metrics: Dict[str, _Metric] = {}
+        self.enabled = PROFILING_ENABLED
+        # (original, wrapper) for every decorated function, so disable()
+        # can put the originals back where they were defined
+        self._wrapped: List[Tuple[Callable, Callable]] = []
+    
+    def _get_or_create(self, name: str) -> _Metric:
+        """
+        Get the metric for a function or block name, creating it if needed.
+        
+        Args:
+            name: Function or block name
+            
+        Returns:
+            The name's _Metric
+        """
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics.setdefault(name, _Metric())
+        return metric
     
     def profile_function(self, func_name: Optional[str] = None) -> Callable:
         """
@@ -40,7 +88,8 @@ class PerformanceProfiler:
             func_name: Optional custom name for the function
             
         Returns:
-            Decorated function
+            Decorated function, or the function itself when profiling is
+            disabled via GRAPHCAST_PROFILING
             
         Example:
             @profiler.profile_function("my_function")
@@ -48,21 +97,31 @@ class PerformanceProfiler:
                 pass
         """
         def decorator(func: Callable) -> Callable:
+            if not PROFILING_ENABLED:
+                return func
+            
             name = func_name or f"{func.__module__}.{func.__name__}"
+            # Bound once here, so calls update it without a name lookup
+            metric = self._get_or_create(name)
             
             @functools.wraps(func)
             def wrapper(*args, **kwargs) -> Any:
                 if not self.enabled:
                     return func(*args, **kwargs)
                 
-                start_time = time.perf_counter()
+                start_ns = perf_counter_ns()
                 try:
-                    result = func(*args, **kwargs)
-                    return result
+                    return func(*args, **kwargs)
                 finally:
-                    elapsed_ms = (time.perf_counter() - start_time) * 1000
-                    self._record_metric(name, elapsed_ms)
+                    elapsed_ns = perf_counter_ns() - start_ns
+                    metric.count += 1
+                    metric.total_ns += elapsed_ns
+                    if metric.count == 1 or elapsed_ns < metric.min_ns:
+                        metric.min_ns = elapsed_ns
+                    if elapsed_ns > metric.max_ns:
+                        metric.max_ns = elapsed_ns
             
+            self._wrapped.append((func, wrapper))
             return wrapper
         return decorator
     
@@ -83,36 +142,42 @@ class PerformanceProfiler:
             yield
             return
         
-        start_time = time.perf_counter()
+        start_ns = perf_counter_ns()
         try:
             yield
         finally:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            self._record_metric(block_name, elapsed_ms)
+            self._record_metric(block_name, perf_counter_ns() - start_ns)
     
-    def _record_metric(self, name: str, elapsed_ms: float):
+    def _record_metric(self, name: str, elapsed_ns: int):
         """
         Record execution time metric.
         
         Args:
             name: Function or block name
-            elapsed_ms: Elapsed time in milliseconds
+            elapsed_ns: Elapsed time in nanoseconds
         """
-        metric = self.metrics[name]
-        metric['count'] += 1
-        metric['total_time_ms'] += elapsed_ms
-        metric['min_time_ms'] = min(metric['min_time_ms'], elapsed_ms)
-        metric['max_time_ms'] = max(metric['max_time_ms'], elapsed_ms)
-        metric['avg_time_ms'] = metric['total_time_ms'] / metric['count']
+        self._get_or_create(name).add(elapsed_ns)
     
     def get_metrics(self) -> Dict[str, Dict[str, float]]:
         """
         Get all recorded metrics.
         
         Returns:
-            Dictionary of metrics by function/block name
+            Dictionary of metrics by function/block name, with times in
+            milliseconds (count, total_time_ms, min_time_ms, max_time_ms,
+            avg_time_ms)
         """
-        return dict(self.metrics)
+        return {
+            name: {
+                'count': metric.count,
+                'total_time_ms': metric.total_ns / 1e6,
+                'min_time_ms': metric.min_ns / 1e6,
+                'max_time_ms': metric.max_ns / 1e6,
+                'avg_time_ms': metric.total_ns / metric.count / 1e6
+            }
+            for name, metric in list(self.metrics.items())
+            if metric.count
+        }
     
     def get_sorted_metrics(self, sort_by: str = 'total_time_ms', limit: int = 10) -> list:
         """
@@ -125,7 +190,7 @@ class PerformanceProfiler:
         Returns:
             List of (name, metrics) tuples sorted by specified field
         """
-        items = list(self.metrics.items())
+        items = list(self.get_metrics().items())
         items.sort(key=lambda x: x[1][sort_by], reverse=True)
         return items[:limit]
     
@@ -163,15 +228,49 @@ class PerformanceProfiler:
     
     def reset(self):
         """Reset all metrics."""
-        self.metrics.clear()
+        # Cleared in place: decorated functions keep references to them
+        for metric in list(self.metrics.values()):
+            metric.clear()
     
     def enable(self):
         """Enable profiling."""
         self.enabled = True
+        self._rebind(use_wrapper=True)
     
     def disable(self):
-        """Disable profiling."""
+        """
+        Disable profiling.
+        
+        Decorated functions are rebound to their originals in the module or
+        class that defines them, so later calls skip the wrapper entirely.
+        References taken before disabling keep the wrapper, which then
+        passes straight through.
+        """
         self.enabled = False
+        self._rebind(use_wrapper=False)
+    
+    def _rebind(self, use_wrapper: bool):
+        """
+        Swap decorated functions between their wrappers and originals.
+        
+        Args:
+            use_wrapper: Install the profiling wrappers if True, the
+                original functions otherwise
+        """
+        for original, wrapper in self._wrapped:
+            current, target = (original, wrapper) if use_wrapper else (wrapper, original)
+            *path, attr = original.__qualname__.split(".")
+            # Functions defined inside other functions cannot be reached
+            if "<locals>" in path:
+                continue
+            
+            owner = sys.modules.get(original.__module__)
+            for part in path:
+                owner = getattr(owner, part, None)
+            
+            # Leave names that were rebound to something else alone
+            if owner is not None and vars(owner).get(attr) is current:
+                setattr(owner, attr, target)
 
 
 def profile_with_cprofile(func: Callable) -> Callable:
@@ -5,10 +5,13 @@ Tests rainfall risk, temperature extreme risk, soil moisture proxy, and confiden
 
 import unittest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 import numpy as np
+from . import agricultural_metrics
 from .agricultural_metrics import (
     AgriculturalMetricsCalculator,
     RainfallRisk,
+    RainfallRiskSeries,
     TempExtremeRisk,
     SoilMoistureProxy
 )
@@ -107,6 +110,58 @@ class TestAgriculturalMetricsCalculator(unittest.TestCase):
             self.assertEqual(risk.daily_precipitation_mm, 0.0)
             self.assertEqual(risk.intensity_mm_per_hour, 0.0)
     
+    def test_rainfall_risk_scores_match_numpy_fallback(self):
+        """Test fused kernel and NumPy fallback produce the same risk scores."""
+        rng = np.random.default_rng(0)
+        daily = rng.uniform(0.0, 300.0, 100)
+        cumulative = rng.uniform(0.0, 400.0, 100)
+        intensity = daily / 24.0
+        
+        scores = self.calculator._calculate_rainfall_risk_scores_vectorized(
+            daily, cumulative, intensity
+        )
+        
+        with patch.object(agricultural_metrics, "_rain_risk_kernel", None):
+            fallback_scores = self.calculator._calculate_rainfall_risk_scores_vectorized(
+                daily, cumulative, intensity
+            )
+        
+        np.testing.assert_allclose(scores, fallback_scores, rtol=1e-5)
+    
+    def test_rainfall_risk_series_columns_and_indexing(self):
+        """Test columnar rainfall results expose arrays and build items on demand."""
+        precipitation = np.array([2.0, 10.0, 40.0])
+        dates = self.dates[:3]
+        
+        risks = self.calculator.calculate_rainfall_risk(precipitation, dates)
+        
+        self.assertIsInstance(risks, RainfallRiskSeries)
+        self.assertEqual(risks.risk_scores.shape, (3,))
+        np.testing.assert_array_equal(risks.daily_precipitation_mm, precipitation)
+        self.assertEqual(list(risks.risk_levels), [risk.risk_level for risk in risks])
+        self.assertEqual(risks[-1], risks[2])
+        self.assertEqual(risks[1:], [risks[1], risks[2]])
+        self.assertEqual(risks[0].date, dates[0])
+        with self.assertRaises(IndexError):
+            risks[3]
+    
+    def test_rainfall_risk_batch_matches_per_location(self):
+        """Test batched multi-location rainfall risk matches per-location calls."""
+        rng = np.random.default_rng(2)
+        precipitation = rng.exponential(20.0, (4, 10))
+        
+        batch = self.calculator.calculate_rainfall_risk_batch(precipitation, self.dates)
+        
+        self.assertEqual(len(batch), 4)
+        for site_precip, series in zip(precipitation, batch):
+            expected = self.calculator.calculate_rainfall_risk(site_precip, self.dates)
+            np.testing.assert_allclose(series.risk_scores, expected.risk_scores, rtol=1e-6)
+            np.testing.assert_allclose(series.cumulative_7day_mm, expected.cumulative_7day_mm, rtol=1e-6)
+            self.assertEqual(list(series.risk_levels), list(expected.risk_levels))
+        
+        with self.assertRaises(ValueError):
+            self.calculator.calculate_rainfall_risk_batch(precipitation[0], self.dates)
+    
     # ========== Temperature Extreme Risk Tests ==========
     
     def test_temperature_extreme_risk_optimal_range(self):
@@ -346,6 +401,30 @@ class TestAgriculturalMetricsCalculator(unittest.TestCase):
         self.assertGreater(proxies[0].drainage_mm, 0.0)
         self.assertEqual(proxies[0].moisture_percent, 100.0)
     
+    def test_soil_moisture_proxy_matches_python_balance(self):
+        """Test compiled water balance matches the pure-Python loop."""
+        rng = np.random.default_rng(1)
+        precipitation = rng.exponential(15.0, 60)
+        temperature = rng.uniform(15.0, 40.0, 60)
+        humidity = rng.uniform(20.0, 95.0, 60)
+        dates = [self.base_date + timedelta(days=i) for i in range(60)]
+        
+        proxies = self.calculator.calculate_soil_moisture_proxy(
+            precipitation, temperature, humidity, dates, initial_moisture=50.0
+        )
+        
+        python_balance = getattr(
+            agricultural_metrics._soil_balance, "py_func", agricultural_metrics._soil_balance
+        )
+        with patch.object(agricultural_metrics, "_soil_balance", python_balance):
+            expected = self.calculator.calculate_soil_moisture_proxy(
+                precipitation, temperature, humidity, dates, initial_moisture=50.0
+            )
+        
+        for proxy, expected_proxy in zip(proxies, expected):
+            self.assertAlmostEqual(proxy.moisture_percent, expected_proxy.moisture_percent, places=4)
+            self.assertAlmostEqual(proxy.drainage_mm, expected_proxy.drainage_mm, places=4)
+    
     def test_soil_moisture_proxy_reset(self):
         """Test soil moisture state reset functionality."""
         # Run calculation to change state
@@ -439,6 +518,31 @@ class TestAgriculturalMetricsCalculator(unittest.TestCase):
         for i in range(len(decay_ratios) - 1):
             if confidences[i+1] > 0.5:  # Not at minimum threshold
                 self.assertAlmostEqual(decay_ratios[i], decay_ratios[i+1], delta=0.05)
+    
+    def test_confidence_score_outside_forecast_horizon(self):
+        """Test that day 0, negative and float days still yield a clipped score."""
+        for day in (0, -1, 2.0):
+            confidence = self.calculator.calculate_confidence_score(forecast_day=day)
+            self.assertIsInstance(confidence, float)
+            self.assertGreaterEqual(confidence, 0.0)
+            self.assertLessEqual(confidence, 1.0)
+        
+        self.assertAlmostEqual(
+            self.calculator.calculate_confidence_score(forecast_day=2.0),
+            self.calculator.calculate_confidence_score(forecast_day=2)
+        )
+    
+    def test_confidence_scores_match_per_day_scores(self):
+        """Test batched confidence scores match the per-day calculation."""
+        scores = self.calculator.calculate_confidence_scores(n_days=15, model_uncertainty=0.2)
+        
+        self.assertEqual(scores.shape, (15,))
+        for day in range(1, 16):
+            self.assertAlmostEqual(
+                scores[day - 1],
+                self.calculator.calculate_confidence_score(forecast_day=day, model_uncertainty=0.2),
+                places=12
+            )
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 
-from .cache_manager import ForecastCacheManager
+from .cache_manager import ForecastCacheManager, SQLiteForecastCacheManager, create_cache_manager
 from .data_models import (
     ForecastResult,
     Location,
@@ -226,6 +226,10 @@ class TestCacheInvalidation:
         assert cache_manager.get_forecast(18.5, 73.8, 10) is None
         assert cache_manager.get_forecast(19.0, 74.0, 10) is None
         assert cache_manager.get_forecast(20.0, 75.0, 10) is None
+        
+        # Writes still work after today's directory was swept away
+        assert cache_manager.set_forecast(18.5, 73.8, 10, sample_forecast) is True
+        assert cache_manager.get_forecast(18.5, 73.8, 10) is not None
 
 
 class TestConcurrentAccess:
@@ -395,5 +399,132 @@ class TestCorruptedCache:
         assert not cache_path.exists()
 
 
+
+class TestMemoryCache:
+    """Test the in-process layer in front of the file cache"""
+    
+    def test_repeat_get_served_from_memory(self, cache_manager, sample_forecast):
+        """Test that a decoded forecast is served without reading the file again"""
+        lat, lon, days = 18.5, 73.8, 10
+        
+        cache_manager.set_forecast(lat, lon, days, sample_forecast)
+        first = cache_manager.get_forecast(lat, lon, days)
+        
+        # Remove the file behind the manager's back; the memory copy still serves
+        cache_key = cache_manager._generate_cache_key(lat, lon, days)
+        cache_manager._get_cache_path(cache_key).unlink()
+        
+        second = cache_manager.get_forecast(lat, lon, days)
+        assert second == first
+        
+        # Every caller gets its own copy, so edits do not leak into later hits
+        second.forecast_days[0].rain_risk = -1.0
+        assert cache_manager.get_forecast(lat, lon, days) == first
+        
+        # Invalidation drops the memory copy as well
+        cache_manager.invalidate_forecast(lat, lon, days)
+        assert cache_manager.get_forecast(lat, lon, days) is None
+    
+    def test_memory_cache_disabled(self, temp_cache_dir, sample_forecast):
+        """Test that a zero-sized memory cache always goes to disk"""
+        cache_manager = ForecastCacheManager(
+            cache_dir=temp_cache_dir,
+            ttl_seconds=3600,
+            memory_cache_size=0
+        )
+        lat, lon, days = 18.5, 73.8, 10
+        
+        cache_manager.set_forecast(lat, lon, days, sample_forecast)
+        first = cache_manager.get_forecast(lat, lon, days)
+        second = cache_manager.get_forecast(lat, lon, days)
+        
+        assert first is not None
+        assert second is not first
+
+class TestCacheFormats:
+    """Test reading cache entries across storage formats"""
+    
+    def test_legacy_json_entry_is_read(self, cache_manager, sample_forecast):
+        """Test that JSON entries written before the msgpack switch are still served"""
+        lat, lon, days = 18.5, 73.8, 10
+        
+        cache_key = cache_manager._generate_cache_key(lat, lon, days)
+        legacy_path = cache_manager._get_cache_path(cache_key).with_suffix(".json")
+        legacy_path.write_text(sample_forecast.to_json())
+        
+        cached = cache_manager.get_forecast(lat, lon, days)
+        assert cached is not None
+        assert cached.location.region == sample_forecast.location.region
+        
+        assert cache_manager.get_cache_stats()['total_forecasts'] == 1
+        assert cache_manager.invalidate_forecast(lat, lon, days) is True
+        assert not legacy_path.exists()
+
+
+class TestSQLiteBackend:
+    """Test the single-database cache backend"""
+    
+    @pytest.fixture
+    def sqlite_cache(self, temp_cache_dir):
+        return create_cache_manager(backend="sqlite", cache_dir=temp_cache_dir, ttl_seconds=3600)
+    
+    def test_factory_selects_backend(self, sqlite_cache, temp_cache_dir):
+        """Test that the factory returns the requested backend"""
+        assert isinstance(sqlite_cache, SQLiteForecastCacheManager)
+        assert type(create_cache_manager(backend="file", cache_dir=temp_cache_dir)) is ForecastCacheManager
+        with pytest.raises(ValueError):
+            create_cache_manager(backend="redis", cache_dir=temp_cache_dir)
+    
+    def test_set_get_invalidate(self, sqlite_cache, sample_forecast):
+        """Test basic operations against the database"""
+        lat, lon, days = 18.5, 73.8, 10
+        
+        assert sqlite_cache.get_forecast(lat, lon, days) is None
+        assert sqlite_cache.set_forecast(lat, lon, days, sample_forecast) is True
+        
+        cached = sqlite_cache.get_forecast(lat, lon, days)
+        assert cached is not None
+        assert cached.to_dict() == sample_forecast.to_dict()
+        
+        stats = sqlite_cache.get_cache_stats()
+        assert stats['total_forecasts'] == 1
+        assert stats['valid_forecasts'] == 1
+        assert stats['total_size_bytes'] > 0
+        
+        assert sqlite_cache.invalidate_forecast(lat, lon, days) is True
+        assert sqlite_cache.invalidate_forecast(lat, lon, days) is False
+        assert sqlite_cache.get_forecast(lat, lon, days) is None
+    
+    def test_expiry_and_cleanup(self, temp_cache_dir, sample_forecast):
+        """Test that expired rows are hidden and removed in one sweep"""
+        sqlite_cache = SQLiteForecastCacheManager(cache_dir=temp_cache_dir, ttl_seconds=1)
+        
+        sqlite_cache.set_forecast(18.5, 73.8, 10, sample_forecast)
+        sqlite_cache.set_forecast(19.0, 74.0, 10, sample_forecast)
+        
+        time.sleep(1.5)
+        
+        assert sqlite_cache.get_forecast(18.5, 73.8, 10) is None
+        assert sqlite_cache.get_cache_stats()['expired_forecasts'] == 2
+        assert sqlite_cache.invalidate_old_forecasts() == 2
+        assert sqlite_cache.get_cache_stats()['total_forecasts'] == 0
+    
+    def test_concurrent_writes(self, sqlite_cache, sample_forecast):
+        """Test writes from several threads, each with its own connection"""
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda i=i: results.append(sqlite_cache.set_forecast(18.5, 73.8, i, sample_forecast))
+            )
+            for i in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert all(results) and len(results) == 10
+        assert all(sqlite_cache.get_forecast(18.5, 73.8, i) is not None for i in range(10))
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
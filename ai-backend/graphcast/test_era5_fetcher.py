@@ -3,6 +3,8 @@ Unit tests for ERA5DataFetcher
 Tests data retrieval, caching, validation, and fallback logic.
 """
 
+import os
+import time
 import pytest
 import asyncio
 import json
@@ -19,7 +21,7 @@ try:
 except ImportError:
     HAS_XARRAY = False
 
-from era5_fetcher import ERA5DataFetcher
+from era5_fetcher import ERA5DataFetcher, _download_target
 
 
 @pytest.fixture
@@ -80,7 +82,7 @@ class TestERA5DataFetcher:
         key2 = fetcher._generate_cache_key(18.0, 21.0, 73.0, 77.0, timestamp)
         
         assert key1 == key2
-        assert len(key1) == 32  # MD5 hash length
+        assert key1 == "era5_18.000_21.000_73.000_77.000_2024010112"
     
     def test_cache_key_uniqueness(self, fetcher):
         """Test different inputs generate different cache keys."""
@@ -145,6 +147,77 @@ class TestERA5DataFetcher:
         assert cached_data is not None
         assert 't2m' in cached_data.variables
     
+    @pytest.mark.asyncio
+    async def test_repeat_hits_reuse_open_dataset(self, fetcher, mock_dataset):
+        """Test repeated cache hits reuse the dataset opened by the first."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        
+        await fetcher._cache_data(
+            mock_dataset, 18.0, 21.0, 73.0, 77.0, timestamp
+        )
+        
+        with patch('xarray.open_dataset', wraps=xr.open_dataset) as mock_open:
+            first = await fetcher.get_cached_data(18.0, 21.0, 73.0, 77.0, timestamp)
+            second = await fetcher.get_cached_data(18.0, 21.0, 73.0, 77.0, timestamp)
+        
+        assert mock_open.call_count == 1
+        assert first is not second
+        assert 't2m' in second.variables
+    
+    @pytest.mark.asyncio
+    async def test_hit_survives_entry_removal(self, fetcher, mock_dataset):
+        """Test a returned dataset stays readable after its entry is removed."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        
+        await fetcher._cache_data(
+            mock_dataset, 18.0, 21.0, 73.0, 77.0, timestamp
+        )
+        cached = await fetcher.get_cached_data(18.0, 21.0, 73.0, 77.0, timestamp)
+        
+        cache_key = fetcher._generate_cache_key(18.0, 21.0, 73.0, 77.0, timestamp)
+        fetcher._forget_dataset(cache_key)
+        fetcher._remove_data_files([cache_key])
+        
+        assert cached['t2m'].values.shape == mock_dataset['t2m'].shape
+    
+    @pytest.mark.asyncio
+    async def test_cache_packs_to_int16(self, fetcher, mock_dataset):
+        """Test cached variables are stored as int16 and round-trip closely."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        mock_dataset['t2m'][:] = 250.0 + 80.0 * mock_dataset['t2m']
+        
+        await fetcher._cache_data(
+            mock_dataset, 18.0, 21.0, 73.0, 77.0, timestamp
+        )
+        cache_key = fetcher._generate_cache_key(18.0, 21.0, 73.0, 77.0, timestamp)
+        
+        cache_file = fetcher.cache_dir / f"{cache_key}.nc"
+        if not cache_file.exists():
+            pytest.skip("cache stored as Zarr")
+        
+        with xr.open_dataset(cache_file, mask_and_scale=False) as raw:
+            assert raw['t2m'].dtype == np.int16
+        
+        cached = await fetcher.get_cached_data(18.0, 21.0, 73.0, 77.0, timestamp)
+        assert np.abs(cached['t2m'].values - mock_dataset['t2m'].values).max() < 0.01
+    
+    @pytest.mark.asyncio
+    async def test_cache_drops_unlimited_dims(self, fetcher, mock_dataset):
+        """Test cached files are written with fixed-size dimensions only."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        mock_dataset.encoding['unlimited_dims'] = {'time'}
+        
+        await fetcher._cache_data(
+            mock_dataset, 18.0, 21.0, 73.0, 77.0, timestamp
+        )
+        cache_key = fetcher._generate_cache_key(18.0, 21.0, 73.0, 77.0, timestamp)
+        cache_file = fetcher.cache_dir / f"{cache_key}.nc"
+        if not cache_file.exists():
+            pytest.skip("cache stored as Zarr")
+        
+        with xr.open_dataset(cache_file) as cached:
+            assert not cached.encoding.get('unlimited_dims')
+    
     @pytest.mark.asyncio
     async def test_cache_miss(self, fetcher):
         """Test cache miss returns None."""
@@ -168,21 +241,16 @@ class TestERA5DataFetcher:
             mock_dataset, lat_min, lat_max, lon_min, lon_max, timestamp
         )
         
-        # Manually modify metadata to simulate expiration
+        # Manually modify the index to simulate expiration
         cache_key = fetcher._generate_cache_key(
             lat_min, lat_max, lon_min, lon_max, timestamp
         )
-        metadata_file = fetcher.cache_dir / f"{cache_key}.json"
-        
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
         
         # Set cached_at to 25 hours ago
-        old_time = datetime.utcnow() - timedelta(hours=25)
-        metadata['cached_at'] = old_time.isoformat()
-        
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f)
+        fetcher._connection().execute(
+            "UPDATE cache_index SET cached_at = ? WHERE cache_key = ?",
+            (time.time() - 25 * 3600, cache_key)
+        )
         
         # Try to retrieve - should return None due to expiration
         cached_data = await fetcher.get_cached_data(
@@ -191,6 +259,23 @@ class TestERA5DataFetcher:
         
         assert cached_data is None
     
+    @pytest.mark.asyncio
+    async def test_index_loaded_on_startup(self, fetcher, mock_dataset):
+        """Test a new fetcher indexes entries already on disk."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        
+        await fetcher._cache_data(
+            mock_dataset, 18.0, 21.0, 73.0, 77.0, timestamp
+        )
+        cache_key = fetcher._generate_cache_key(18.0, 21.0, 73.0, 77.0, timestamp)
+        
+        restarted = ERA5DataFetcher(cache_dir=str(fetcher.cache_dir))
+        
+        assert restarted._index_entry(cache_key) == fetcher._index_entry(cache_key)
+        assert await restarted.get_cached_data(
+            18.0, 21.0, 73.0, 77.0, timestamp
+        ) is not None
+    
     @pytest.mark.asyncio
     async def test_cleanup_expired_cache(self, fetcher, mock_dataset):
         """Test cleanup removes expired cache entries."""
@@ -207,22 +292,38 @@ class TestERA5DataFetcher:
         cache_key = fetcher._generate_cache_key(
             lat_min, lat_max, lon_min, lon_max, timestamp
         )
-        metadata_file = fetcher.cache_dir / f"{cache_key}.json"
+        fetcher._connection().execute(
+            "UPDATE cache_index SET cached_at = ? WHERE cache_key = ?",
+            (time.time() - 25 * 3600, cache_key)
+        )
         
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
+        # Run cleanup
+        deleted_count = await fetcher.cleanup_expired_cache()
         
-        old_time = datetime.utcnow() - timedelta(hours=25)
-        metadata['cached_at'] = old_time.isoformat()
+        assert deleted_count == 1
+        assert not (fetcher.cache_dir / f"{cache_key}.nc").exists()
+        assert fetcher._index_entry(cache_key) is None
+    
+    @pytest.mark.asyncio
+    async def test_legacy_sidecars_imported(self, fetcher, mock_dataset):
+        """Test JSON sidecars from older versions move into the index."""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        cache_key = fetcher._generate_cache_key(18.0, 21.0, 73.0, 77.0, timestamp)
         
+        mock_dataset.to_netcdf(fetcher.cache_dir / f"{cache_key}.nc")
+        metadata_file = fetcher.cache_dir / f"{cache_key}.json"
         with open(metadata_file, 'w') as f:
-            json.dump(metadata, f)
+            json.dump({'cached_at': datetime.utcnow().isoformat()}, f)
         
-        # Run cleanup
-        deleted_count = await fetcher.cleanup_expired_cache()
+        restarted = ERA5DataFetcher(cache_dir=str(fetcher.cache_dir))
         
-        assert deleted_count == 1
         assert not metadata_file.exists()
+        assert restarted._index_entry(cache_key)[1] is False
+        assert await restarted.get_cached_data(
+            18.0, 21.0, 73.0, 77.0, timestamp
+        ) is not None
+        # Validated on first load, trusted afterwards
+        assert restarted._index_entry(cache_key)[1] is True
     
     @pytest.mark.asyncio
     async def test_fetch_with_cache_hit(self, fetcher, mock_dataset):
@@ -262,6 +363,59 @@ class TestERA5DataFetcher:
             assert data is not None
             assert fetcher.validate_data(data)
     
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_coalesced(self, fetcher, mock_dataset):
+        """Test identical concurrent misses share a single API call."""
+        timestamp = datetime.utcnow()
+        call_count = 0
+        
+        async def slow_fetch(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return mock_dataset
+        
+        with patch.object(fetcher, '_fetch_from_cds_with_retry', side_effect=slow_fetch):
+            results = await asyncio.gather(*[
+                fetcher.fetch_initial_conditions(18.0, 21.0, 73.0, 77.0, timestamp)
+                for _ in range(3)
+            ])
+        
+        assert call_count == 1
+        assert all(result is not None for result in results)
+        assert not fetcher._inflight
+    
+    @pytest.mark.asyncio
+    async def test_fetch_batch_single_request_per_region(self, fetcher):
+        """Test batch fetch issues one API call per region and splits hours."""
+        if not HAS_XARRAY:
+            pytest.skip("xarray not installed")
+        
+        hours = [datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 6)]
+        combined = xr.Dataset(
+            {
+                var: (['time', 'lat', 'lon'], np.random.rand(2, 10, 10))
+                for var in ('t2m', 'sp', 'r', 'u10', 'v10')
+            },
+            coords={
+                'time': hours,
+                'lat': np.linspace(18.0, 21.0, 10),
+                'lon': np.linspace(73.0, 77.0, 10),
+            }
+        )
+        
+        with patch.object(
+            fetcher, '_fetch_from_cds_batch', AsyncMock(return_value=combined)
+        ) as mock_fetch:
+            results = await fetcher.fetch_initial_conditions_batch([
+                (18.0, 21.0, 73.0, 77.0, ts) for ts in hours
+            ])
+        
+        mock_fetch.assert_awaited_once()
+        assert [r.sizes['time'] for r in results] == [1, 1]
+        assert results[1]['t2m'].values[0].tolist() == combined['t2m'].values[1].tolist()
+        assert await fetcher.get_cached_data(18.0, 21.0, 73.0, 77.0, hours[1]) is not None
+    
     @pytest.mark.asyncio
     async def test_fetch_fallback_to_recent_cache(self, fetcher, mock_dataset):
         """Test fetch falls back to recent cached data when API fails."""
@@ -299,7 +453,7 @@ class TestERA5DataFetcher:
             raise Exception("API Error")
         
         with patch.object(fetcher, '_fetch_from_cds', side_effect=mock_fetch_fail):
-            with patch('time.sleep'):  # Mock sleep to speed up test
+            with patch('asyncio.sleep', new=AsyncMock()):  # Mock sleep to speed up test
                 data = await fetcher._fetch_from_cds_with_retry(
                     lat_min, lat_max, lon_min, lon_max, timestamp
                 )
@@ -308,6 +462,44 @@ class TestERA5DataFetcher:
                 assert call_count == fetcher.max_retries
                 assert data is None
     
+    def test_download_target_leaves_no_file(self, fetcher, mock_dataset):
+        """Test downloads can be read back and leave nothing in the cache dir."""
+        with _download_target(fetcher.cache_dir, "temp_test.nc") as target:
+            mock_dataset.to_netcdf(target)
+            with xr.open_dataset(target) as downloaded:
+                assert downloaded.load()['t2m'].shape == (1, 10, 10)
+        
+        assert list(fetcher.cache_dir.glob("temp_*")) == []
+    
+    @pytest.mark.asyncio
+    async def test_fetch_from_cds_async_client(self, fetcher, mock_dataset):
+        """Test the async CDS client submits, polls and downloads a request."""
+        httpx = pytest.importorskip("httpx")
+        payload = bytes(mock_dataset.to_netcdf())
+        requested = []
+        
+        def handler(request):
+            requested.append((request.method, request.url.path))
+            if request.method == "POST":
+                return httpx.Response(200, json={"state": "queued", "request_id": "r1"})
+            if request.url.path.endswith("/tasks/r1"):
+                return httpx.Response(200, json={"state": "completed", "location": "/download/r1.nc"})
+            return httpx.Response(200, content=payload)
+        
+        real_client = httpx.AsyncClient
+        
+        def mock_client(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+        
+        with patch('httpx.AsyncClient', side_effect=mock_client), \
+                patch('asyncio.sleep', new=AsyncMock()):
+            data = await fetcher._fetch_from_cds(
+                18.0, 21.0, 73.0, 77.0, datetime(2024, 1, 1, 12)
+            )
+        
+        assert [method for method, _ in requested] == ["POST", "GET", "GET"]
+        assert fetcher.validate_data(data)
+    
     @pytest.mark.asyncio
     async def test_validation_failure_returns_none(self, fetcher):
         """Test that invalid data is not cached and returns None."""
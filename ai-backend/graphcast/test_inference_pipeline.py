@@ -9,6 +9,7 @@ import time
 from datetime import datetime
 from pathlib import Path
 import sys
+from unittest.mock import patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,6 +25,7 @@ from graphcast.inference_pipeline import (
     ForecastResult,
     Location,
     ForecastDay,
+    ForecastDaysSoA,
     RawWeatherData
 )
 from graphcast.model_manager import GraphCastModelManager
@@ -306,8 +308,9 @@ async def test_preprocessing_handles_missing_data(inference_pipeline):
     assert preprocessed is not None
     
     # Verify no NaN values in preprocessed data
-    for var_name, var_data in preprocessed['data'].items():
-        assert not np.isnan(var_data).any(), f"Variable {var_name} should not contain NaN"
+    data = np.asarray(preprocessed['data'])
+    for var_name, index in preprocessed['variables'].items():
+        assert not np.isnan(data[index]).any(), f"Variable {var_name} should not contain NaN"
     
     print(f"✓ Missing data handling test passed")
 
@@ -362,6 +365,73 @@ async def test_daily_aggregation_from_6hour_predictions(inference_pipeline):
     print(f"✓ Daily aggregation test passed")
 
 
+def test_postprocess_accepts_device_predictions(inference_pipeline):
+    """Test that predictions left on the device postprocess like host arrays"""
+    import jax.numpy as jnp
+    
+    steps = np.arange(8, dtype=np.float32)
+    predictions = {
+        'temperature': 290.0 + steps,
+        'precipitation': steps / 4,
+        'humidity': 60.0 + steps,
+        'u_wind': np.full(8, 3.0, dtype=np.float32),
+        'v_wind': np.full(8, 4.0, dtype=np.float32),
+        'num_steps': 8
+    }
+    on_device = {
+        name: jnp.asarray(value) if isinstance(value, np.ndarray) else value
+        for name, value in predictions.items()
+    }
+    timestamp = datetime(2024, 1, 1, 12)
+    
+    expected = inference_pipeline._postprocess_outputs(predictions, 19.0, 74.0, 'maharashtra', timestamp)
+    result = inference_pipeline._postprocess_outputs(on_device, 19.0, 74.0, 'maharashtra', timestamp)
+    
+    assert result is not None
+    assert list(result.forecast_days) == list(expected.forecast_days)
+    assert result.forecast_days[0].raw_weather.wind_speed_ms == pytest.approx(5.0)
+
+
+def test_forecast_days_soa_materializes_days():
+    """Test that column-wise forecast days convert to ForecastDay objects and back"""
+    days = ForecastDaysSoA(
+        dates=np.array(['2024-01-02', '2024-01-03'], dtype='datetime64[us]'),
+        rain_risk=np.array([10.0, 20.0]),
+        temp_extreme=np.zeros(2),
+        soil_moisture_proxy=np.zeros(2),
+        confidence_score=np.array([1.0, 0.95]),
+        raw_weather={
+            'precipitation_mm': np.array([1.5, 0.0], dtype=np.float32),
+            'temp_max_c': np.array([30.0, 31.0]),
+            'temp_min_c': np.array([20.0, 21.0]),
+            'temp_mean_c': np.array([25.0, 26.0]),
+            'humidity_percent': np.array([60.0, 55.0]),
+            'wind_speed_ms': np.array([3.0, 4.0])
+        }
+    )
+    
+    assert len(days) == 2
+    day = days[-1]
+    assert isinstance(day, ForecastDay)
+    assert day.date == datetime(2024, 1, 3) and type(day.date) is datetime
+    assert [d.date for d in days] == [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+    assert day.rain_risk == 20.0 and isinstance(day.rain_risk, float)
+    assert day.raw_weather.temp_max_c == 31.0
+    assert [d.confidence_score for d in days] == [1.0, 0.95]
+    assert all(type(d.raw_weather.precipitation_mm) is float for d in days)
+    with pytest.raises(IndexError):
+        days[2]
+    
+    # Slices give lists of days, like a list of ForecastDay would
+    assert days[:] == list(days)
+    assert days[1:] == [day]
+    assert days[::-1] == list(days)[::-1]
+    assert days[5:] == []
+    
+    rebuilt = ForecastDaysSoA.from_forecast_days(list(days))
+    assert list(rebuilt) == list(days)
+
+
 def test_normalization_parameters():
     """Test that normalization parameters are reasonable"""
     from graphcast.inference_pipeline import GraphCastInferencePipeline
@@ -373,20 +443,21 @@ def test_normalization_parameters():
     fetcher = ERA5DataFetcher()
     pipeline = GraphCastInferencePipeline(manager, fetcher)
     
-    # Test data
-    test_data = {
-        'temperature': np.array([273.15, 283.15, 293.15]),  # 0°C, 10°C, 20°C
-        'pressure': np.array([101325, 100000, 102000]),
-        'humidity': np.array([50, 60, 70]),
-        'u_wind': np.array([0, 5, -5]),
-        'v_wind': np.array([0, 3, -3]),
-    }
+    # Test data, stacked in temperature/pressure/humidity/u_wind/v_wind order
+    var_names = ['temperature', 'pressure', 'humidity', 'u_wind', 'v_wind']
+    test_data = np.array([
+        [273.15, 283.15, 293.15],  # 0°C, 10°C, 20°C
+        [101325, 100000, 102000],
+        [50, 60, 70],
+        [0, 5, -5],
+        [0, 3, -3],
+    ], dtype=np.float32)
     
     # Normalize
-    normalized = pipeline._normalize_variables(test_data)
+    normalized = np.asarray(pipeline._normalize_variables(test_data))
     
     # Verify normalization produces reasonable values
-    for var_name, var_data in normalized.items():
+    for var_name, var_data in zip(var_names, normalized):
         # Normalized values should typically be in range [-5, 5] for z-score
         assert np.abs(var_data).max() < 10, \
             f"Normalized {var_name} values seem unreasonable"
@@ -394,6 +465,176 @@ def test_normalization_parameters():
     print(f"✓ Normalization parameters test passed")
 
 
+def test_rollout_fn_compiled_once_per_shape_and_length():
+    """Test that compiled rollouts are reused per (shape, num_steps)"""
+    from graphcast.inference_pipeline import _get_rollout_fn, _ROLLOUT_DTYPE
+    
+    rollout_fn = _get_rollout_fn((5, 10, 10), 8)
+    
+    assert _get_rollout_fn((5, 10, 10), 8) is rollout_fn
+    assert _get_rollout_fn((5, 10, 10), 12) is not rollout_fn
+    
+    state = np.random.standard_normal((1, 5, 10, 10)).astype(_ROLLOUT_DTYPE)
+    index = np.array([3], dtype=np.int32)
+    final_state, readouts = rollout_fn(state, index, index + 1)
+    readouts = np.asarray(readouts)
+    assert final_state.shape == state.shape
+    assert readouts.shape == (1, 8, 5)
+    assert readouts.dtype == np.float32
+    assert np.allclose(readouts[0], state[0, :, 3, 4].astype(np.float32))
+
+
+@pytest.mark.asyncio
+async def test_repeat_requests_served_from_result_cache(inference_pipeline, mock_data_fetcher):
+    """Test that nearby requests in the same hour reuse one forecast"""
+    with patch.object(
+        mock_data_fetcher, 'fetch_initial_conditions', wraps=mock_data_fetcher.fetch_initial_conditions
+    ) as fetch:
+        first = await inference_pipeline.run_inference(19.0, 74.0, forecast_days=3)
+        second = await inference_pipeline.run_inference(19.001, 74.0, forecast_days=3)
+        other_horizon = await inference_pipeline.run_inference(19.0, 74.0, forecast_days=5)
+    
+    assert fetch.call_count == 2
+    assert first.metadata.cache_hit is False
+    assert second.metadata.cache_hit is True
+    assert second.location.latitude == 19.001
+    assert [d.raw_weather.temp_max_c for d in second.forecast_days] == \
+        [d.raw_weather.temp_max_c for d in first.forecast_days]
+    assert len(other_horizon.forecast_days) == 5
+    
+    # Callers get their own copies, so replacing columns does not leak
+    first.forecast_days.rain_risk = np.full(3, 99.0)
+    third = await inference_pipeline.run_inference(19.0, 74.0, forecast_days=3)
+    assert all(d.rain_risk == 0.0 for d in third.forecast_days)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_coalesced(inference_pipeline, mock_data_fetcher):
+    """Test that concurrent identical requests share one inference"""
+    with patch.object(
+        mock_data_fetcher, 'fetch_initial_conditions', wraps=mock_data_fetcher.fetch_initial_conditions
+    ) as fetch:
+        results = await asyncio.gather(*(
+            inference_pipeline.run_inference(19.0, 74.0, forecast_days=3) for _ in range(3)
+        ))
+    
+    assert fetch.call_count == 1
+    assert [r.metadata.cache_hit for r in results] == [False, True, True]
+    assert len({id(r) for r in results}) == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rollouts_batched(inference_pipeline, mock_data_fetcher):
+    """Test that concurrent rollouts of the same shape run as one vmapped batch"""
+    from graphcast import inference_pipeline as ip_module
+    
+    dataset = await mock_data_fetcher.fetch_initial_conditions(18.0, 21.0, 73.0, 77.0, datetime.utcnow())
+    targets = [(18.5, 73.5), (19.0, 74.0), (20.5, 76.5)]
+    preprocessed = [inference_pipeline._preprocess_inputs(dataset, lat, lon) for lat, lon in targets]
+    
+    with patch.object(ip_module, '_get_rollout_fn', wraps=ip_module._get_rollout_fn) as get_fn:
+        readouts = await asyncio.gather(*(
+            inference_pipeline._rollout(data, 8) for data in preprocessed
+        ))
+    
+    # One dispatch, padded from 3 requests to a batch of 4
+    get_fn.assert_called_once_with((5, 10, 10), 8, 4)
+    for data, readout in zip(preprocessed, readouts):
+        coords = data['coordinates']
+        expected = np.asarray(data['data'])[:, coords['target_lat_idx'], coords['target_lon_idx']]
+        assert np.allclose(np.asarray(readout), expected.astype(np.float32))
+
+
+@pytest.mark.asyncio
+async def test_device_inputs_reused_per_region_hour(inference_pipeline, mock_data_fetcher):
+    """Test that preprocessed device inputs are reused for the same region and hour"""
+    timestamp = datetime(2024, 1, 1, 12)
+    dataset = await mock_data_fetcher.fetch_initial_conditions(18.0, 21.0, 73.0, 77.0, timestamp)
+    key = ('maharashtra', timestamp)
+    
+    first = inference_pipeline._preprocess_inputs(dataset, 18.5, 73.5, input_key=key)
+    with patch.object(inference_pipeline, '_to_device_inputs') as to_device:
+        second = inference_pipeline._preprocess_inputs(dataset, 20.5, 76.5, input_key=key)
+    
+    to_device.assert_not_called()
+    assert second['data'] is first['data']
+    assert second['coordinates']['target_lat_idx'] != first['coordinates']['target_lat_idx']
+    
+    # Running a batch donates only the stacked copy, not the cached inputs
+    await inference_pipeline._rollout(second, 4)
+    assert not first['data'].is_deleted()
+
+
+@pytest.mark.asyncio
+async def test_batch_inference_matches_single_requests(inference_pipeline):
+    """Test that batched locations get the same forecasts as single requests"""
+    from graphcast.inference_pipeline import _get_multipoint_rollout_fn
+    
+    latlons = np.array([[18.5, 73.8], [20.0, 76.0], [10.0, 70.0], [19.5, 74.5]])
+    
+    with patch(
+        'graphcast.inference_pipeline._get_multipoint_rollout_fn',
+        wraps=_get_multipoint_rollout_fn
+    ) as get_fn:
+        results = await inference_pipeline.run_inference_batch(latlons, forecast_days=3)
+    
+    # One forward pass for the region, padded to four points
+    get_fn.assert_called_once_with((5, 10, 10), 12, 4)
+    assert len(results) == 4
+    assert results[2] is None  # Outside every region
+    assert [r.location.latitude for r in results if r is not None] == [18.5, 20.0, 19.5]
+    
+    # Single requests are served from the results the batch cached...
+    single = await inference_pipeline.run_inference(20.0, 76.0, forecast_days=3)
+    assert single.metadata.cache_hit
+    
+    # ...and match what a fresh single request computes on the same inputs
+    inference_pipeline._results.clear()
+    for batched, (lat, lon) in zip(results, latlons.tolist()):
+        if batched is None:
+            continue
+        single = await inference_pipeline.run_inference(lat, lon, forecast_days=3)
+        assert not single.metadata.cache_hit
+        assert list(single.forecast_days) == list(batched.forecast_days)
+
+
+@pytest.mark.asyncio
+async def test_warmup_compiles_canonical_shapes(inference_pipeline):
+    """Test that warmup compiles the kernels for each region's ERA5 grid"""
+    from graphcast.inference_pipeline import _get_rollout_fn
+    
+    assert await inference_pipeline.warmup() is True
+    
+    # Maharashtra at 0.25 degrees: one hour of a 13 x 17 grid
+    shape = (5, 1, 13, 17)
+    assert shape in inference_pipeline._preprocess_kernels
+    hits = _get_rollout_fn.cache_info().hits
+    _get_rollout_fn(shape, inference_pipeline.max_forecast_days * 4)
+    assert _get_rollout_fn.cache_info().hits == hits + 1
+
+
+def test_preprocess_kernel_compiled_once_per_shape(inference_pipeline):
+    """Test that the preprocessing kernel is reused for inputs of the same shape"""
+    kernel = inference_pipeline._preprocess_kernel((5, 10, 10))
+    
+    assert inference_pipeline._preprocess_kernel((5, 10, 10)) is kernel
+    assert inference_pipeline._preprocess_kernel((5, 1, 10, 10)) is not kernel
+    
+    # Missing values become the normalized climatological mean (0)
+    data = np.full((5, 10, 10), 300.0, dtype=np.float32)
+    data[0, 0, 0] = np.nan
+    data[1] = np.nan
+    normalized, missing = kernel(data)
+    normalized = np.asarray(normalized, dtype=np.float32)
+    assert np.isfinite(normalized).all()
+    assert normalized[0, 0, 0] == 0.0
+    assert (normalized[1] == 0.0).all()
+    # Outputs are in the (possibly bfloat16) rollout dtype
+    assert np.isclose(normalized[0, 0, 1], (300.0 - 273.15) / 20.0, rtol=1e-2)
+    # Missing values are counted per variable
+    assert np.asarray(missing).tolist() == [1, 100, 0, 0, 0]
+
+
 if __name__ == "__main__":
     # Run tests
     print("Running GraphCast Inference Pipeline Integration Tests\n")
@@ -29,6 +29,7 @@ class TestGraphCastModelManager:
         # Cleanup
         if temp_path.exists():
             temp_path.unlink()
+        temp_path.with_suffix(".npz.sha256.json").unlink(missing_ok=True)
     
     @pytest.fixture
     def manager_with_temp_weights(self, temp_weights_file):
@@ -96,6 +97,16 @@ class TestGraphCastModelManager:
         assert result2 is True
         assert manager_with_temp_weights.is_model_loaded()
     
+    @pytest.mark.asyncio
+    async def test_ensure_loaded_loads_once(self, manager_with_temp_weights):
+        """Test that ensure_loaded loads on first use and is a no-op afterwards"""
+        assert await manager_with_temp_weights.ensure_loaded() is True
+        assert manager_with_temp_weights.is_model_loaded()
+        
+        with patch.object(manager_with_temp_weights, 'load_model') as load_model:
+            assert await manager_with_temp_weights.ensure_loaded() is True
+        load_model.assert_not_called()
+    
     def test_validate_weights_file_missing(self):
         """Test validation fails for missing weights file"""
         manager = GraphCastModelManager(model_path="/nonexistent/path.npz", device="cpu")
@@ -131,6 +142,68 @@ class TestGraphCastModelManager:
         assert isinstance(checksum, str)
         assert len(checksum) == 64  # SHA256 produces 64 hex characters
     
+    def test_calculate_checksum_matches_whole_file_digest(self, tmp_path, monkeypatch):
+        """Test that chunked hashing matches hashing the file in one piece"""
+        import hashlib
+        from . import model_manager
+        
+        # Not a multiple of the chunk size, so the last read is partial
+        data = bytes(range(256)) * (model_manager._HASH_CHUNK // 256 + 3)
+        weights = tmp_path / "weights.npz"
+        weights.write_bytes(data)
+        manager = GraphCastModelManager(model_path=str(weights), device="cpu")
+        
+        assert manager._hash_file("sha256") == hashlib.sha256(data).hexdigest()
+        assert manager._hash_file("md5") == hashlib.md5(data).hexdigest()
+        
+        # Same digest when the file is too large to map...
+        monkeypatch.setattr(model_manager, "_available_memory", lambda: 0)
+        assert manager._hash_file("sha256") == hashlib.sha256(data).hexdigest()
+        
+        # ...and from the chunked fallback used before Python 3.11
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        assert manager._hash_file("sha256") == hashlib.sha256(data).hexdigest()
+    
+    def test_parallel_checksum_is_tree_of_shard_digests(self, tmp_path):
+        """Test the sharded tree checksum against a serial computation"""
+        import hashlib
+        
+        data = bytes(range(256)) * 41  # Last shard is partial
+        weights = tmp_path / "weights.npz"
+        weights.write_bytes(data)
+        manager = GraphCastModelManager(model_path=str(weights), device="cpu")
+        
+        shard = 1000
+        expected = hashlib.sha256(b"".join(
+            hashlib.sha256(data[i:i + shard]).digest() for i in range(0, len(data), shard)
+        )).hexdigest()
+        
+        assert manager._calculate_checksum_parallel(shard_size=shard) == expected
+        assert manager._calculate_checksum("sha256-tree-64M") == \
+            hashlib.sha256(hashlib.sha256(data).digest()).hexdigest()
+    
+    def test_checksum_cached_until_weights_change(self, tmp_path):
+        """Test that the checksum is reused until the weights file changes"""
+        import hashlib
+        import os
+        
+        weights = tmp_path / "weights.npz"
+        weights.write_bytes(b"a" * 1024)
+        manager = GraphCastModelManager(model_path=str(weights), device="cpu")
+        
+        first = manager._calculate_checksum()
+        assert (tmp_path / "weights.npz.sha256.json").exists()
+        
+        with patch.object(manager, "_hash_file") as hash_file:
+            assert manager._calculate_checksum() == first
+            hash_file.assert_not_called()
+        
+        # Rewriting the file invalidates the cached digest
+        weights.write_bytes(b"b" * 1024)
+        st = weights.stat()
+        os.utime(weights, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert manager._calculate_checksum() == hashlib.sha256(b"b" * 1024).hexdigest()
+    
     def test_get_model_info_not_loaded(self):
         """Test getting model info when model is not loaded"""
         manager = GraphCastModelManager(device="cpu")
@@ -161,6 +234,24 @@ class TestGraphCastModelManager:
         assert not manager_with_temp_weights.is_model_loaded()
         assert manager_with_temp_weights.model is None
     
+    @pytest.mark.asyncio
+    async def test_weights_validated_off_event_loop(self, manager_with_temp_weights):
+        """Test that weights validation does not run on the event loop thread"""
+        import threading
+        
+        loop_thread = threading.get_ident()
+        validation_threads = []
+        
+        def validate():
+            validation_threads.append(threading.get_ident())
+            return True
+        
+        with patch.object(manager_with_temp_weights, '_validate_weights_file', side_effect=validate):
+            assert await manager_with_temp_weights.load_model()
+        
+        assert len(validation_threads) == 1
+        assert validation_threads[0] != loop_thread
+    
     @pytest.mark.asyncio
     async def test_concurrent_loading(self, manager_with_temp_weights):
         """Test that concurrent load attempts are handled correctly"""
@@ -193,6 +284,7 @@ class TestModelManagerEdgeCases:
                 assert result is False
         finally:
             temp_path.unlink()
+            temp_path.with_suffix(".npz.sha256.json").unlink(missing_ok=True)
     
     @pytest.mark.asyncio
     async def test_load_model_exception_handling(self):
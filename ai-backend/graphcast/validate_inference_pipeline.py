@@ -99,26 +99,28 @@ try:
     else:
         import numpy as np
         
-        test_data = {
-            'temperature': np.array([273.15, 283.15, 293.15]),
-            'pressure': np.array([101325, 100000, 102000]),
-            'humidity': np.array([50, 60, 70]),
-            'u_wind': np.array([0, 5, -5]),
-            'v_wind': np.array([0, 3, -3]),
-        }
+        # Variables stacked in temperature/pressure/humidity/u_wind/v_wind order
+        test_data = np.array([
+            [273.15, 283.15, 293.15],
+            [101325, 100000, 102000],
+            [50, 60, 70],
+            [0, 5, -5],
+            [0, 3, -3],
+        ], dtype=np.float32)
         
-        normalized = pipeline._normalize_variables(test_data)
+        normalized = np.asarray(pipeline._normalize_variables(test_data))
         
         # Check that normalization was applied
-        assert 'temperature' in normalized
-        assert len(normalized['temperature']) == 3
+        assert normalized.shape == (5, 3)
+        assert abs(normalized[0, 0]) < 1e-6
         print("   ✓ Normalization works correctly")
         
-        # Test interpolation
-        data_with_nan = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
-        interpolated = pipeline._interpolate_missing_data(data_with_nan)
-        assert not np.isnan(interpolated).any()
-        print("   ✓ Missing data interpolation works")
+        # Test missing data filling
+        test_data[0, 1] = np.nan
+        filled = np.asarray(pipeline._normalize_variables(test_data))
+        assert not np.isnan(filled).any()
+        assert filled[0, 1] == 0.0
+        print("   ✓ Missing data filling works")
     
 except ImportError:
     print("   ⚠ NumPy not available, skipping normalization tests")
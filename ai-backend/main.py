@@ -20,9 +20,9 @@ import uuid
 # GraphCast imports
 from graphcast.model_manager import GraphCastModelManager
 from graphcast.era5_fetcher import ERA5DataFetcher
-from graphcast.inference_pipeline import GraphCastInferencePipeline
+from graphcast.inference_pipeline import GraphCastInferencePipeline, ForecastDaysSoA
 from graphcast.agricultural_metrics import AgriculturalMetricsCalculator
-from graphcast.cache_manager import ForecastCacheManager
+from graphcast.cache_manager import create_cache_manager
 from graphcast.config import validate_coordinates
 from graphcast.request_queue import get_queue_manager, initialize_queue_manager, shutdown_queue_manager, RequestPriority
 from graphcast.profiler import get_profiler
@@ -356,10 +356,16 @@ async def load_models():
                 model_manager=graphcast_model_manager,
                 data_fetcher=graphcast_era5_fetcher
             )
-            graphcast_cache_manager = ForecastCacheManager()
+            graphcast_cache_manager = create_cache_manager()
             graphcast_metrics_calculator = AgriculturalMetricsCalculator()
             graphcast_initialized = True
             logger.info("   ✅ GraphCast system initialized successfully")
+            
+            # Compile the inference graph now rather than on the first request
+            if await graphcast_inference_pipeline.warmup():
+                logger.info("   ✅ GraphCast inference graph compiled")
+            else:
+                logger.info("   ⚠️  GraphCast will compile on the first request")
         except Exception as e:
             logger.error(f"   ❌ Could not initialize GraphCast: {e}")
             logger.info("   ⚠️  GraphCast endpoints will return errors")
@@ -1079,21 +1085,19 @@ def _calculate_agricultural_metrics(forecast_result):
         Updated ForecastResult with agricultural metrics
     """
     try:
-        # Extract raw weather data
-        dates = [day.date for day in forecast_result.forecast_days]
-        precipitation = [day.raw_weather.precipitation_mm for day in forecast_result.forecast_days]
-        temp_max = [day.raw_weather.temp_max_c for day in forecast_result.forecast_days]
-        temp_min = [day.raw_weather.temp_min_c for day in forecast_result.forecast_days]
-        temp_mean = [day.raw_weather.temp_mean_c for day in forecast_result.forecast_days]
-        humidity = [day.raw_weather.humidity_percent for day in forecast_result.forecast_days]
+        # Work on the column layout; pipeline results already use it
+        daily = forecast_result.forecast_days
+        if not isinstance(daily, ForecastDaysSoA):
+            daily = ForecastDaysSoA.from_forecast_days(daily)
         
-        # Convert to numpy arrays
+        # Extract raw weather data
         import numpy as np
-        precipitation_arr = np.array(precipitation)
-        temp_max_arr = np.array(temp_max)
-        temp_min_arr = np.array(temp_min)
-        temp_mean_arr = np.array(temp_mean)
-        humidity_arr = np.array(humidity)
+        dates = daily.dates.tolist()
+        precipitation_arr = daily.raw_weather['precipitation_mm'].astype(np.float32)
+        temp_max_arr = daily.raw_weather['temp_max_c'].astype(np.float32)
+        temp_min_arr = daily.raw_weather['temp_min_c'].astype(np.float32)
+        temp_mean_arr = daily.raw_weather['temp_mean_c'].astype(np.float32)
+        humidity_arr = daily.raw_weather['humidity_percent'].astype(np.float32)
         
         # Calculate metrics
         rainfall_risks = graphcast_metrics_calculator.calculate_rainfall_risk(
@@ -1114,17 +1118,17 @@ def _calculate_agricultural_metrics(forecast_result):
             dates=dates
         )
         
-        # Update forecast days with calculated metrics
-        for i, day in enumerate(forecast_result.forecast_days):
-            day.rain_risk = rainfall_risks[i].risk_score
-            day.temp_extreme = temp_extreme_risks[i].risk_score
-            day.soil_moisture_proxy = soil_moisture_proxies[i].moisture_percent
-            
-            # Recalculate confidence score
-            day.confidence_score = graphcast_metrics_calculator.calculate_confidence_score(
-                forecast_day=i + 1
-            )
+        # Update forecast days with calculated metrics, column by column
+        daily.rain_risk = rainfall_risks.risk_scores
+        daily.temp_extreme = temp_extreme_risks.risk_scores
+        daily.soil_moisture_proxy = soil_moisture_proxies.moisture_percent
+        
+        # Recalculate confidence scores for the whole horizon at once
+        daily.confidence_score = graphcast_metrics_calculator.calculate_confidence_scores(
+            n_days=len(dates)
+        )
         
+        forecast_result.forecast_days = daily
         return forecast_result
         
     except Exception as e: